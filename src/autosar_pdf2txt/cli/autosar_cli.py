@@ -10,6 +10,9 @@ from autosar_pdf2txt import PdfParser, MarkdownWriter
 from autosar_pdf2txt.writer import JsonWriter
 from autosar_pdf2txt.models import AutosarClass, AutosarEnumeration, AutosarPrimitive
 
+# Output format inferred from each recognized output file extension
+_FORMAT_BY_SUFFIX = {".md": "markdown", ".json": "json"}
+
 
 def infer_format_from_path(output_path: Optional[str]) -> Optional[str]:
     """Infer output format from file extension.
@@ -26,12 +29,7 @@ def infer_format_from_path(output_path: Optional[str]) -> Optional[str]:
     if not output_path:
         return None
 
-    path = Path(output_path)
-    if path.suffix.lower() == ".json":
-        return "json"
-    elif path.suffix.lower() == ".md":
-        return "markdown"
-    return None
+    return _FORMAT_BY_SUFFIX.get(Path(output_path).suffix.lower())
 
 
 def main() -> int:
@@ -43,6 +41,8 @@ def main() -> int:
         SWR_CLI_00011: CLI Class Files Flag
         SWR_CLI_00012: CLI Class Hierarchy Flag
         SWR_CLI_00014: CLI Logger File Specification
+        SWR_CLI_00015: CLI Parallel Parsing Option
+        SWR_CLI_00016: CLI PDF Text Cache Option
 
     Returns:
         Exit code (0 for success, 1 for error).
@@ -65,7 +65,7 @@ def main() -> int:
     parser.add_argument(
         "--format",
         type=str,
-        choices=["markdown", "json"],
+        choices=list(_FORMAT_BY_SUFFIX.values()),
         default=None,
         help="Output format (default: inferred from file extension, or markdown)",
     )
@@ -90,6 +90,18 @@ def main() -> int:
         type=str,
         help="Write log messages to the specified file (in addition to stderr)",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of PDF files to parse in parallel (default: 1, 0: one per available CPU)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        help="Directory in which text extracted from the PDFs is cached and reused by later runs",
+    )
 
     args = parser.parse_args()
 
@@ -184,10 +196,17 @@ def main() -> int:
         logging.error("No PDF files to process")
         return 1
 
+    # SWR_CLI_00015: CLI Parallel Parsing Option
+    if args.jobs < 0:
+        root_logger.error(f"Number of jobs must not be negative: {args.jobs}")
+        return 1
+    max_workers = args.jobs if args.jobs > 0 else None
+
     try:
         # Parse all PDFs using parse_pdfs() to ensure parent/child relationships
         # are resolved after all models are loaded (not per-PDF)
-        pdf_parser = PdfParser()
+        # SWR_CLI_00016: CLI PDF Text Cache Option
+        pdf_parser = PdfParser(cache_dir=args.cache_dir)
 
         # SWR_CLI_00007: CLI Progress Feedback
         logging.info(f"🔄 Parsing {len(pdf_paths)} PDF file(s)...")
@@ -195,7 +214,7 @@ def main() -> int:
         pdf_path_strings = [str(pdf_path) for pdf_path in pdf_paths]
 
         # Parse all PDFs at once - parent/children resolution happens on complete model
-        doc = pdf_parser.parse_pdfs(pdf_path_strings)
+        doc = pdf_parser.parse_pdfs(pdf_path_strings, max_workers=max_workers)
 
         # Calculate statistics
         total_classes = 0
@@ -26,23 +26,16 @@ def is_autosar_table(table: List[List[Optional[str]]]) -> bool:
     if not header:
         return False
 
-    # Normalize header values: convert to lowercase, strip whitespace, handle None
-    normalized_header = []
-    for cell in header:
-        if cell is None:
-            normalized_header.append("")
-        else:
-            normalized_header.append(str(cell).strip().lower())
+    # Normalize the whole header in one go: join the cells with a record
+    # separator (never part of PDF text, so no match can span two cells),
+    # then lowercase once instead of once per cell
+    normalized_header = "\x1e".join(
+        "" if cell is None else str(cell) for cell in header
+    ).lower()
 
     # Check if the header contains both "class" and "package" fields
-    has_class = False
-    has_package = False
-
-    for cell in normalized_header:
-        if "class" in cell:
-            has_class = True
-        if "package" in cell:
-            has_package = True
+    has_class = "class" in normalized_header
+    has_package = "package" in normalized_header
 
     is_autosar = has_class and has_package
 
@@ -69,28 +62,32 @@ def extract_tables_from_pdf(pdf_path: Path, output_dir: Path) -> List[Path]:
     try:
         with pdfplumber.open(pdf_path) as pdf:
             for page_num, page in enumerate(pdf.pages, start=1):
-                # Extract tables from the current page
-                tables = page.extract_tables()
+                # Find tables on the current page once and reuse the result for
+                # both the cell contents and the bounding boxes
+                tables_found = page.find_tables()
+
+                if tables_found:
+                    logging.debug(f"Found {len(tables_found)} table(s) on page {page_num}")
 
-                if tables:
-                    logging.debug(f"Found {len(tables)} table(s) on page {page_num}")
+                    # The page image is only needed once an AUTOSAR table is found,
+                    # and then only once per page
+                    img = None
 
-                    for table_num, table in enumerate(tables, start=1):
+                    for table_num, found_table in enumerate(tables_found, start=1):
                         # Check if this is an AUTOSAR-related table
+                        table = found_table.extract()
                         if not is_autosar_table(table):
                             logging.debug(f"  Skipping table {table_num} on page {page_num} - not AUTOSAR-related")
                             continue
 
                         # Create an image from the page
-                        img = page.to_image()
+                        if img is None:
+                            img = page.to_image()
+                            page_image = img.original
 
                         # Crop the image to the table area
-                        # First, find the bounding box of the table
-                        tables_found = page.find_tables()
-                        if tables_found and table_num - 1 < len(tables_found):
-                            bbox = tables_found[table_num - 1].bbox
-                            # Use PIL's crop method on the underlying PIL image
-                            img.original = img.original.crop(bbox)
+                        # Use PIL's crop method on the underlying PIL image
+                        img.original = page_image.crop(found_table.bbox)
 
                         # Save the image
                         img_path = output_dir / f"table_page{page_num}_table{table_num}.png"
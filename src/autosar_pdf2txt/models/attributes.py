@@ -8,15 +8,17 @@ Requirements:
     SWR_MODEL_00014: AUTOSAR Enumeration Literal Representation
     SWR_MODEL_00015: AUTOSAR Enumeration Literal Name Validation
     SWR_MODEL_00016: AUTOSAR Enumeration Literal String Representation
+    SWR_MODEL_00034: Shared Name and Package Path Strings
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, Optional
 
 from autosar_pdf2txt.models.enums import AttributeKind
 
 
-@dataclass
+@dataclass(slots=True)
 class AutosarEnumLiteral:
     """Represents an enumeration literal value.
 
@@ -48,12 +50,14 @@ class AutosarEnumLiteral:
 
         Requirements:
             SWR_MODEL_00015: AUTOSAR Enumeration Literal Name Validation
+            SWR_MODEL_00034: Shared Name and Package Path Strings
 
         Raises:
             ValueError: If name is empty or contains only whitespace.
         """
-        if not self.name or not self.name.strip():
+        if not self.name or self.name.isspace():
             raise ValueError("Enumeration literal name cannot be empty")
+        self.name = sys.intern(self.name)
 
     def __str__(self) -> str:
         """Return string representation of the literal.
@@ -82,7 +86,7 @@ class AutosarEnumLiteral:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AutosarAttribute:
     """Represents an AUTOSAR class attribute.
 
@@ -115,14 +119,20 @@ class AutosarAttribute:
         Requirements:
             SWR_MODEL_00011: AUTOSAR Attribute Name Validation
             SWR_MODEL_00012: AUTOSAR Attribute Type Validation
+            SWR_MODEL_00034: Shared Name and Package Path Strings
 
         Raises:
             ValueError: If name or type is empty or contains only whitespace.
         """
-        if not self.name or not self.name.strip():
+        if not self.name or self.name.isspace():
             raise ValueError("Attribute name cannot be empty")
-        if not self.type or not self.type.strip():
+        if not self.type or self.type.isspace():
             raise ValueError("Attribute type cannot be empty")
+        # Types such as "String" and multiplicities such as "0..1" repeat
+        # across thousands of attributes
+        self.name = sys.intern(self.name)
+        self.type = sys.intern(self.type)
+        self.multiplicity = sys.intern(self.multiplicity)
 
     def __str__(self) -> str:
         """Return string representation of the attribute.
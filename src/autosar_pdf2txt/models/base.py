@@ -5,12 +5,13 @@ Requirements:
     SWR_MODEL_00027: AUTOSAR Source Location Representation
 """
 
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, List, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AutosarDocumentSource:
     """Represents a source location for an AUTOSAR type.
 
@@ -63,6 +64,7 @@ class AutosarDocumentSource:
         return "\n".join(lines)
 
 
+@dataclass(eq=False, repr=False)
 class AbstractAutosarBase(ABC):
     """Abstract base class for AUTOSAR type definitions.
 
@@ -85,10 +87,18 @@ class AbstractAutosarBase(ABC):
         >>> # Instead, use AutosarClass or AutosarEnumeration
     """
 
-    name: str
-    package: str
-    note: Optional[str]
-    sources: List[AutosarDocumentSource]
+    # Declared as fields so that every slotted subclass holds them in its own
+    # slots; compare=False keeps equality limited to the subclass fields. The
+    # base itself only declares empty slots: with slots=True here, Python 3.10
+    # would declare the inherited slots again in each subclass (mypy does not
+    # see the empty slots, as it would reject the assignments in __init__).
+    if not TYPE_CHECKING:
+        __slots__ = ()
+
+    name: str = field(compare=False)
+    package: str = field(compare=False)
+    note: Optional[str] = field(default=None, compare=False)
+    sources: List[AutosarDocumentSource] = field(default_factory=list, compare=False)
 
     def __init__(
         self,
@@ -102,6 +112,7 @@ class AbstractAutosarBase(ABC):
         Requirements:
             SWR_MODEL_00018: AUTOSAR Type Abstract Base Class
             SWR_MODEL_00027: AUTOSAR Source Location Representation
+            SWR_MODEL_00034: Shared Name and Package Path Strings
 
         Args:
             name: The name of the type.
@@ -113,10 +124,12 @@ class AbstractAutosarBase(ABC):
         Raises:
             ValueError: If name is empty or contains only whitespace.
         """
-        if not name or not name.strip():
+        if not name or name.isspace():
             raise ValueError("Type name cannot be empty")
-        self.name = name
-        self.package = package
+        # Names are looked up and compared across the whole model, and all types
+        # of a package repeat the same path, so share one string per value
+        self.name = sys.intern(name)
+        self.package = sys.intern(package)
         self.note = note
         self.sources = sources if sources is not None else []
 
@@ -12,16 +12,50 @@ Requirements:
     SWR_MODEL_00025: AUTOSAR Package Primitive Type Support
     SWR_MODEL_00028: Query Classes Implementing Interface
     SWR_MODEL_00029: Query Interfaces for Class
+    SWR_MODEL_00033: Indexed Package Queries
+    SWR_MODEL_00034: Shared Name and Package Path Strings
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 from autosar_pdf2txt.models.enums import ATPType
 from autosar_pdf2txt.models.types import AutosarClass, AutosarEnumeration, AutosarPrimitive
 
 
-@dataclass
+def _find_position(items: Sequence[Any], positions: Dict[str, int], name: str) -> int | None:
+    """Find the position of the item with a name.
+
+    The recorded position of the name is used only if the item at that
+    position still has the name; otherwise the items are scanned and the
+    position found is recorded. Lists changed directly, including entries
+    replaced in place, are therefore always seen.
+
+    Requirements:
+        SWR_MODEL_00023: AUTOSAR Document Representation
+        SWR_MODEL_00033: Indexed Package Queries
+
+    Args:
+        items: The items to search, each with a name attribute.
+        positions: Recorded positions of the items by name, updated in place.
+        name: The name to find.
+
+    Returns:
+        The position of the item if found, None otherwise.
+    """
+    position = positions.get(name)
+    if position is not None and position < len(items) and items[position].name == name:
+        return position
+    for position, item in enumerate(items):
+        if item.name == name:
+            positions[name] = position
+            return position
+    positions.pop(name, None)
+    return None
+
+
+@dataclass(slots=True)
 class AutosarPackage:
     """Represents an AUTOSAR package containing types and subpackages.
 
@@ -47,18 +81,54 @@ class AutosarPackage:
     name: str
     types: List[Union[AutosarClass, AutosarEnumeration, AutosarPrimitive]] = field(default_factory=list)
     subpackages: List["AutosarPackage"] = field(default_factory=list)
+    # Positions of the types and subpackages by name, recorded by the add_*
+    # methods and by lookups; each one is checked against the list before use
+    _type_positions: Dict[str, int] = field(init=False, repr=False, compare=False, default_factory=dict)
+    _subpackage_positions: Dict[str, int] = field(init=False, repr=False, compare=False, default_factory=dict)
 
     def __post_init__(self) -> None:
         """Validate the package fields.
 
         Requirements:
             SWR_MODEL_00005: AUTOSAR Package Name Validation
+            SWR_MODEL_00034: Shared Name and Package Path Strings
 
         Raises:
             ValueError: If name is empty or contains only whitespace.
         """
-        if not self.name or not self.name.strip():
+        if not self.name or self.name.isspace():
             raise ValueError("Package name cannot be empty")
+        self.name = sys.intern(self.name)
+
+    def _find_type(self, name: str) -> AutosarClass | AutosarEnumeration | AutosarPrimitive | None:
+        """Find a type by name, using its recorded position when still valid.
+
+        Requirements:
+            SWR_MODEL_00033: Indexed Package Queries
+
+        Args:
+            name: The name of the type to find.
+
+        Returns:
+            The type if found, None otherwise.
+        """
+        position = _find_position(self.types, self._type_positions, name)
+        return None if position is None else self.types[position]
+
+    def _find_subpackage(self, name: str) -> "AutosarPackage | None":
+        """Find a subpackage by name, using its recorded position when still valid.
+
+        Requirements:
+            SWR_MODEL_00033: Indexed Package Queries
+
+        Args:
+            name: The name of the subpackage to find.
+
+        Returns:
+            The subpackage if found, None otherwise.
+        """
+        position = _find_position(self.subpackages, self._subpackage_positions, name)
+        return None if position is None else self.subpackages[position]
 
     def add_type(self, typ: Union[AutosarClass, AutosarEnumeration, AutosarPrimitive]) -> None:
         """Add a type (class, enumeration, or primitive) to the package.
@@ -75,19 +145,20 @@ class AutosarPackage:
             If a type with the same name already exists, the sources are merged.
             This allows tracking when a type is defined in multiple PDFs.
         """
-        for existing_type in self.types:
-            if existing_type.name == typ.name:
-                # Merge sources from the duplicate type
-                existing_sources = {str(s) for s in existing_type.sources}
-                new_sources = {str(s) for s in typ.sources}
-                added_sources = new_sources - existing_sources
-
-                if added_sources:
-                    # Add only non-duplicate sources
-                    for source in typ.sources:
-                        if str(source) in added_sources:
-                            existing_type.sources.append(source)
-                return
+        existing_type = self._find_type(typ.name)
+        if existing_type is not None:
+            # Merge sources from the duplicate type
+            existing_sources = {str(s) for s in existing_type.sources}
+            new_sources = {str(s) for s in typ.sources}
+            added_sources = new_sources - existing_sources
+
+            if added_sources:
+                # Add only non-duplicate sources
+                for source in typ.sources:
+                    if str(source) in added_sources:
+                        existing_type.sources.append(source)
+            return
+        self._type_positions[typ.name] = len(self.types)
         self.types.append(typ)
 
     def add_class(self, cls: AutosarClass) -> None:
@@ -134,9 +205,9 @@ class AutosarPackage:
         Raises:
             ValueError: If a subpackage with the same name already exists.
         """
-        pkg_names = {p.name for p in self.subpackages}
-        if pkg.name in pkg_names:
+        if self._find_subpackage(pkg.name) is not None:
             raise ValueError(f"Subpackage '{pkg.name}' already exists in package '{self.name}'")
+        self._subpackage_positions[pkg.name] = len(self.subpackages)
         self.subpackages.append(pkg)
 
     def get_type(self, name: str) -> Optional[Union[AutosarClass, AutosarEnumeration, AutosarPrimitive]]:
@@ -153,10 +224,7 @@ class AutosarPackage:
         Returns:
             The AutosarClass, AutosarEnumeration, or AutosarPrimitive if found, None otherwise.
         """
-        for typ in self.types:
-            if typ.name == name:
-                return typ
-        return None
+        return self._find_type(name)
 
     def get_class(self, name: str) -> Optional[AutosarClass]:
         """Get a class by name.
@@ -174,10 +242,8 @@ class AutosarPackage:
         Note:
             This method is maintained for backward compatibility and returns only AutosarClass instances.
         """
-        for typ in self.types:
-            if isinstance(typ, AutosarClass) and typ.name == name:
-                return typ
-        return None
+        typ = self._find_type(name)
+        return typ if isinstance(typ, AutosarClass) else None
 
     def get_enumeration(self, name: str) -> Optional[AutosarEnumeration]:
         """Get an enumeration by name.
@@ -191,10 +257,8 @@ class AutosarPackage:
         Returns:
             The AutosarEnumeration if found, None otherwise.
         """
-        for typ in self.types:
-            if isinstance(typ, AutosarEnumeration) and typ.name == name:
-                return typ
-        return None
+        typ = self._find_type(name)
+        return typ if isinstance(typ, AutosarEnumeration) else None
 
     def add_primitive(self, primitive: AutosarPrimitive) -> None:
         """Add a primitive type to the package.
@@ -222,10 +286,8 @@ class AutosarPackage:
         Returns:
             The AutosarPrimitive if found, None otherwise.
         """
-        for typ in self.types:
-            if isinstance(typ, AutosarPrimitive) and typ.name == name:
-                return typ
-        return None
+        typ = self._find_type(name)
+        return typ if isinstance(typ, AutosarPrimitive) else None
 
     def get_subpackage(self, name: str) -> Optional["AutosarPackage"]:
         """Get a subpackage by name.
@@ -239,10 +301,7 @@ class AutosarPackage:
         Returns:
             The AutosarPackage if found, None otherwise.
         """
-        for pkg in self.subpackages:
-            if pkg.name == name:
-                return pkg
-        return None
+        return self._find_subpackage(name)
 
     def has_type(self, name: str) -> bool:
         """Check if a type (class, enumeration, or primitive) exists in the package.
@@ -258,7 +317,7 @@ class AutosarPackage:
         Returns:
             True if the type exists, False otherwise.
         """
-        return any(typ.name == name for typ in self.types)
+        return self._find_type(name) is not None
 
     def get_classes_implementing_interface(self, interface_name: str) -> List[AutosarClass]:
         """Get all classes in this package that implement a specific ATP interface.
@@ -341,7 +400,7 @@ class AutosarPackage:
         Note:
             This method is maintained for backward compatibility and checks only for AutosarClass instances.
         """
-        return any(isinstance(typ, AutosarClass) and typ.name == name for typ in self.types)
+        return isinstance(self._find_type(name), AutosarClass)
 
     def has_enumeration(self, name: str) -> bool:
         """Check if an enumeration exists in the package.
@@ -355,7 +414,7 @@ class AutosarPackage:
         Returns:
             True if the enumeration exists, False otherwise.
         """
-        return any(isinstance(typ, AutosarEnumeration) and typ.name == name for typ in self.types)
+        return isinstance(self._find_type(name), AutosarEnumeration)
 
     def has_primitive(self, name: str) -> bool:
         """Check if a primitive type exists in the package.
@@ -369,7 +428,7 @@ class AutosarPackage:
         Returns:
             True if the primitive type exists, False otherwise.
         """
-        return any(isinstance(typ, AutosarPrimitive) and typ.name == name for typ in self.types)
+        return isinstance(self._find_type(name), AutosarPrimitive)
 
     def has_subpackage(self, name: str) -> bool:
         """Check if a subpackage exists in the package.
@@ -383,7 +442,7 @@ class AutosarPackage:
         Returns:
             True if the subpackage exists, False otherwise.
         """
-        return any(pkg.name == name for pkg in self.subpackages)
+        return self._find_subpackage(name) is not None
 
     def __str__(self) -> str:
         """Return string representation of the package.
@@ -393,12 +452,13 @@ class AutosarPackage:
             SWR_MODEL_00020: AUTOSAR Package Type Support
             SWR_MODEL_00025: AUTOSAR Package Primitive Type Support
         """
-        parts = [f"Package '{self.name}'"]
+        if self.types and self.subpackages:
+            return f"Package '{self.name}' ({len(self.types)} types, {len(self.subpackages)} subpackages)"
         if self.types:
-            parts.append(f"{len(self.types)} types")
+            return f"Package '{self.name}' ({len(self.types)} types)"
         if self.subpackages:
-            parts.append(f"{len(self.subpackages)} subpackages")
-        return " (".join(parts) + ")"
+            return f"Package '{self.name}' ({len(self.subpackages)} subpackages)"
+        return f"Package '{self.name}'"
 
     def __repr__(self) -> str:
         """Return detailed representation for debugging.
@@ -414,7 +474,7 @@ class AutosarPackage:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AutosarDoc:
     """Represents an AUTOSAR document containing packages and root classes.
 
@@ -436,9 +496,13 @@ class AutosarDoc:
 
     packages: List[AutosarPackage]
     root_classes: List[AutosarClass]
+    # Positions of the packages and root classes by name, recorded in
+    # __post_init__ and by lookups; each one is checked against the list before use
+    _package_positions: Dict[str, int] = field(init=False, repr=False, compare=False, default_factory=dict)
+    _root_class_positions: Dict[str, int] = field(init=False, repr=False, compare=False, default_factory=dict)
 
     def __post_init__(self) -> None:
-        """Validate the document fields.
+        """Validate the document fields and record their positions by name.
 
         Requirements:
             SWR_MODEL_00023: AUTOSAR Document Representation
@@ -447,14 +511,16 @@ class AutosarDoc:
             ValueError: If packages or root_classes contain duplicate names.
         """
         # Check for duplicate package names
-        pkg_names = [pkg.name for pkg in self.packages]
-        if len(pkg_names) != len(set(pkg_names)):
-            raise ValueError("Duplicate package names found in packages")
+        for position, pkg in enumerate(self.packages):
+            if pkg.name in self._package_positions:
+                raise ValueError(f"Duplicate package names found in packages: '{pkg.name}'")
+            self._package_positions[pkg.name] = position
 
         # Check for duplicate root class names
-        root_cls_names = [cls.name for cls in self.root_classes]
-        if len(root_cls_names) != len(set(root_cls_names)):
-            raise ValueError("Duplicate root class names found in root_classes")
+        for position, cls in enumerate(self.root_classes):
+            if cls.name in self._root_class_positions:
+                raise ValueError(f"Duplicate root class names found in root_classes: '{cls.name}'")
+            self._root_class_positions[cls.name] = position
 
     def get_package(self, name: str) -> Optional[AutosarPackage]:
         """Get a package by name.
@@ -468,10 +534,8 @@ class AutosarDoc:
         Returns:
             The AutosarPackage if found, None otherwise.
         """
-        for pkg in self.packages:
-            if pkg.name == name:
-                return pkg
-        return None
+        position = _find_position(self.packages, self._package_positions, name)
+        return None if position is None else self.packages[position]
 
     def get_root_class(self, name: str) -> Optional[AutosarClass]:
         """Get a root class by name.
@@ -485,10 +549,8 @@ class AutosarDoc:
         Returns:
             The AutosarClass if found, None otherwise.
         """
-        for cls in self.root_classes:
-            if cls.name == name:
-                return cls
-        return None
+        position = _find_position(self.root_classes, self._root_class_positions, name)
+        return None if position is None else self.root_classes[position]
 
     def get_classes_implementing_interface(self, interface_name: str) -> List[AutosarClass]:
         """Get all classes in the document that implement a specific ATP interface.
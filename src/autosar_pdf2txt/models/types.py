@@ -26,7 +26,7 @@ from autosar_pdf2txt.models.base import AbstractAutosarBase, AutosarDocumentSour
 from autosar_pdf2txt.models.enums import ATPType
 
 
-@dataclass
+@dataclass(slots=True)
 class AutosarClass(AbstractAutosarBase):
     """Represents an AUTOSAR class.
 
@@ -128,7 +128,8 @@ class AutosarClass(AbstractAutosarBase):
         Raises:
             ValueError: If name is empty or contains only whitespace.
         """
-        super().__init__(name, package, note, sources)
+        # slots=True rebuilds the class, so the zero-argument super() cell would be stale
+        AbstractAutosarBase.__init__(self, name, package, note, sources)
         self.is_abstract = is_abstract
         self.atp_type = atp_type
         self.attributes = attributes or {}
@@ -162,21 +163,16 @@ class AutosarClass(AbstractAutosarBase):
         SWR_MODEL_00021: AUTOSAR Class Multi-Level Inheritance Hierarchy
 
         """
-        attrs_count = len(self.attributes)
-        bases_count = len(self.bases)
-        children_count = len(self.children)
-        subclasses_count = len(self.subclasses)
-        implements_count = len(self.implements)
-        note_present = self.note is not None
         return (
             f"AutosarClass(name='{self.name}', is_abstract={self.is_abstract}, "
             f"atp_type={self.atp_type.name}, "
-            f"attributes={attrs_count}, bases={bases_count}, parent={self.parent}, "
-            f"children={children_count}, subclasses={subclasses_count}, implements={implements_count}, note={note_present})"
+            f"attributes={len(self.attributes)}, bases={len(self.bases)}, parent={self.parent}, "
+            f"children={len(self.children)}, subclasses={len(self.subclasses)}, "
+            f"implements={len(self.implements)}, note={self.note is not None})"
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AutosarEnumeration(AbstractAutosarBase):
     """Represents an AUTOSAR enumeration type.
 
@@ -232,7 +228,7 @@ class AutosarEnumeration(AbstractAutosarBase):
         Raises:
             ValueError: If name is empty or contains only whitespace.
         """
-        super().__init__(name, package, note, sources)
+        AbstractAutosarBase.__init__(self, name, package, note, sources)
         # Convert to tuple for immutability
         self.enumeration_literals = tuple(enumeration_literals) if enumeration_literals else ()
 
@@ -254,16 +250,14 @@ class AutosarEnumeration(AbstractAutosarBase):
         Requirements:
             SWR_MODEL_00019: AUTOSAR Enumeration Type Representation
         """
-        literals_count = len(self.enumeration_literals)
-        note_present = self.note is not None
         return (
             f"AutosarEnumeration(name='{self.name}', "
             f"package='{self.package}', "
-            f"enumeration_literals={literals_count}, note={note_present})"
+            f"enumeration_literals={len(self.enumeration_literals)}, note={self.note is not None})"
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AutosarPrimitive(AbstractAutosarBase):
     """Represents an AUTOSAR primitive type.
 
@@ -314,7 +308,7 @@ class AutosarPrimitive(AbstractAutosarBase):
         Raises:
             ValueError: If name is empty or contains only whitespace.
         """
-        super().__init__(name, package, note, sources)
+        AbstractAutosarBase.__init__(self, name, package, note, sources)
         self.attributes = attributes or {}
 
     def __str__(self) -> str:
@@ -335,10 +329,8 @@ class AutosarPrimitive(AbstractAutosarBase):
         Requirements:
             SWR_MODEL_00024: AUTOSAR Primitive Type Representation
         """
-        attrs_count = len(self.attributes)
-        note_present = self.note is not None
         return (
             f"AutosarPrimitive(name='{self.name}', "
             f"package='{self.package}', "
-            f"attributes={attrs_count}, note={note_present})"
+            f"attributes={len(self.attributes)}, note={self.note is not None})"
         )
\ No newline at end of file
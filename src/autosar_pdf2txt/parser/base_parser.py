@@ -13,7 +13,7 @@ Requirements:
 
 import re
 from abc import ABC, abstractmethod
-from typing import Dict, List, Match, Optional, Tuple, Union
+from typing import ClassVar, Dict, List, Match, Optional, Tuple, Union
 
 from autosar_pdf2txt.models import (
     ATPType,
@@ -63,10 +63,15 @@ class AbstractTypeParser(ABC):
     ENUMERATION_LITERAL_HEADER_PATTERN = re.compile(r"^Literal\s+Description$")
     ENUMERATION_LITERAL_PATTERN = re.compile(r"^([a-zA-Z_][a-zA-Z0-9_]*)(?:\s+(.*))?$")
     ATTRIBUTE_PATTERN = re.compile(r"^(\S+)\s+(\S+)\s+.*$")
-    ATP_MIXED_STRING_PATTERN = re.compile(r"<<atpMixedString>>")
-    ATP_VARIATION_PATTERN = re.compile(r"<<atpVariation>>")
-    ATP_MIXED_PATTERN = re.compile(r"<<atpMixed>>")
-    ATP_PROTOTYPE_PATTERN = re.compile(r"<<atpPrototype>>")
+    ATP_MARKER_PATTERN = re.compile(r"<<(atpMixedString|atpVariation|atpMixed|atpPrototype)>>")
+
+    # ATP type of each marker matched by ATP_MARKER_PATTERN
+    ATP_TYPES_BY_MARKER: ClassVar[Dict[str, ATPType]] = {
+        "atpMixedString": ATPType.ATP_MIXED_STRING,
+        "atpVariation": ATPType.ATP_VARIATION,
+        "atpMixed": ATPType.ATP_MIXED,
+        "atpPrototype": ATPType.ATP_PROTO,
+    }
 
     # Class constants for filtering and continuation detection
     # SWR_PARSER_00012: Multi-Line Attribute Handling
@@ -74,8 +79,10 @@ class AbstractTypeParser(ABC):
     CONTINUATION_TYPES = {"data", "If", "has", "to", "of", "CP", "atpSplitable"}
     FRAGMENT_NAMES = {"Element", "SizeProfile", "intention", "ImplementationDataType"}
     PARTIAL_NAMES = {"isStructWith"}
+    BROKEN_FRAGMENT_NAMES = FRAGMENT_NAMES | PARTIAL_NAMES
     CONTINUATION_FRAGMENTS = {"Element", "Referrable", "Packageable", "Type", "Profile"}
     REFERENCE_INDICATORS = {"Prototype", "Ref", "Dependency", "Trigger", "Mapping", "Group", "Set", "List", "Collection"}
+    REFERENCE_INDICATOR_PATTERN = re.compile("|".join(sorted(REFERENCE_INDICATORS)))
 
     # Attribute kind values for parsing
     ATTR_KINDS_ATTR = {"attr"}
@@ -86,6 +93,15 @@ class AbstractTypeParser(ABC):
     # Multiplicity values for parsing
     MULTIPLICITIES = {"0..1", "0..*", "*", "1"}
 
+    # Package path validation
+    # SWR_PARSER_00006: Package Hierarchy Building
+    SUSPICIOUS_PACKAGE_PHRASES = (
+        "the ", " is ", " of ", " for ", " and ", " or ", " a ", " an ",
+        "This ", "These ", "The ", "A ", "An ",
+    )
+    PACKAGE_KEYWORD_PATTERN = re.compile(r"\bpackage\b|\bPackage\b|\btemplate\b|\bTemplate\b")
+    SINGLE_LEVEL_PACKAGE_PATTERN = re.compile(r"^[A-Z][a-zA-Z0-9]*(_[a-zA-Z0-9]+)*$")
+
     def _is_reference_type(self, attr_type: str) -> bool:
         """Determine if an attribute type is a reference type.
 
@@ -100,7 +116,7 @@ class AbstractTypeParser(ABC):
 
         Reference types typically end with common AUTOSAR reference patterns.
         """
-        return any(indicator in attr_type for indicator in self.REFERENCE_INDICATORS)
+        return self.REFERENCE_INDICATOR_PATTERN.search(attr_type) is not None
 
     def _is_broken_attribute_fragment(
         self, attr_name: str, attr_type: str
@@ -119,8 +135,7 @@ class AbstractTypeParser(ABC):
         """
         return (
             attr_type in self.CONTINUATION_TYPES
-            or attr_name in self.FRAGMENT_NAMES
-            or attr_name in self.PARTIAL_NAMES
+            or attr_name in self.BROKEN_FRAGMENT_NAMES
         )
 
     def _is_valid_package_path(self, package_path: str) -> bool:
@@ -147,38 +162,27 @@ class AbstractTypeParser(ABC):
         """
         # Check for suspicious patterns that indicate descriptive text
         # rather than actual package paths
-        suspicious_patterns = [
-            "the ", " is ", " of ", " for ", " and ", " or ", " a ", " an ",
-            "This ", "These ", "The ", "A ", "An ",
-        ]
-        for pattern in suspicious_patterns:
+        for pattern in self.SUSPICIOUS_PACKAGE_PHRASES:
             if pattern in package_path:
                 return False
 
         # Check for standalone "package", "Package", "template", or "Template" words
         # Use word boundary matching to avoid false positives (e.g., "Some_Package", "Templates")
-        if re.search(r"\bpackage\b|\bPackage\b|\btemplate\b|\bTemplate\b", package_path):
+        if self.PACKAGE_KEYWORD_PATTERN.search(package_path):
             return False
 
         # Remove M2:: prefix if present for further validation
-        test_path = package_path
-        if test_path.startswith("M2::"):
-            test_path = test_path[4:]
-
-        # Check for empty parts (e.g., "AUTOSAR::" or "::Package")
-        if "::" in test_path:
-            parts = test_path.split("::")
-            if any(not part for part in parts):
-                return False
+        test_path = package_path.removeprefix("M2::")
 
         # Multi-level paths are generally valid if they pass the above checks
+        # and have no empty parts (e.g., "AUTOSAR::" or "::Package")
         if "::" in test_path:
-            return True
+            return "" not in test_path.split("::")
 
         # Single-level paths: only accept if they follow proper naming conventions
         # - Start with underscore (e.g., _PrivatePackage)
         # - TitleCase format (e.g., SomePackage, Some_Package)
-        if test_path.startswith("_") or re.match(r"^[A-Z][a-zA-Z0-9]*(_[a-zA-Z0-9]+)*$", test_path):
+        if test_path.startswith("_") or self.SINGLE_LEVEL_PACKAGE_PATTERN.match(test_path):
             return True
 
         # Single-level paths with lowercase start are likely descriptive text
@@ -199,36 +203,20 @@ class AbstractTypeParser(ABC):
         Raises:
             ValueError: If multiple ATP markers are detected on the same class.
         """
-        # Detect ATP patterns
-        atp_mixed_string = self.ATP_MIXED_STRING_PATTERN.search(raw_class_name)
-        atp_variation = self.ATP_VARIATION_PATTERN.search(raw_class_name)
-        atp_mixed = self.ATP_MIXED_PATTERN.search(raw_class_name)
-        atp_prototype = self.ATP_PROTOTYPE_PATTERN.search(raw_class_name)
-
-        atp_markers = [atp_mixed_string, atp_variation, atp_mixed, atp_prototype]
-        found_markers = [m for m in atp_markers if m is not None]
+        # Detect all ATP markers in a single scan of the name
+        found_markers = set(self.ATP_MARKER_PATTERN.findall(raw_class_name))
+        if not found_markers:
+            return ATPType.NONE, raw_class_name
 
+        # Repeating the same marker is allowed, combining different ones is not
         if len(found_markers) > 1:
             raise ValueError(
                 f"Multiple ATP markers detected in class name: {raw_class_name}"
             )
 
-        # Determine ATP type
-        if atp_mixed_string:
-            atp_type = ATPType.ATP_MIXED_STRING
-        elif atp_variation:
-            atp_type = ATPType.ATP_VARIATION
-        elif atp_mixed:
-            atp_type = ATPType.ATP_MIXED
-        elif atp_prototype:
-            atp_type = ATPType.ATP_PROTO
-        else:
-            atp_type = ATPType.NONE
-
         # Remove ATP markers from class name
-        clean_name = raw_class_name
-        for marker in found_markers:
-            clean_name = clean_name.replace(marker.group(0), "").strip()
+        atp_type = self.ATP_TYPES_BY_MARKER[found_markers.pop()]
+        clean_name = self.ATP_MARKER_PATTERN.sub("", raw_class_name).strip()
 
         return atp_type, clean_name
 
@@ -253,8 +241,7 @@ class AbstractTypeParser(ABC):
             ";" in attr_name or
             attr_name.isdigit() or
             attr_type in self.CONTINUATION_TYPES or
-            attr_name in self.FRAGMENT_NAMES or
-            attr_name in self.PARTIAL_NAMES
+            attr_name in self.BROKEN_FRAGMENT_NAMES
         )
 
     def _create_attribute_from_pending(
@@ -306,6 +293,7 @@ class AbstractTypeParser(ABC):
             SWR_PARSER_00010: Attribute Extraction from PDF
             SWR_PARSER_00011: Attribute Metadata Filtering
             SWR_PARSER_00012: Multi-Line Attribute Handling
+            SWR_MODEL_00034: Shared Name and Package Path Strings
 
         Args:
             attributes: Dictionary to add the attribute to.
@@ -324,7 +312,8 @@ class AbstractTypeParser(ABC):
                     pending_attr_kind or AttributeKind.ATTR,
                     pending_attr_note or ""
                 )
-                attributes[pending_attr_name] = attr
+                # Key by the interned attribute name so the key is shared with the attribute
+                attributes[attr.name] = attr
 
     def _is_valid_type_definition(self, lines: List[str], start_index: int) -> bool:
         """Check if this is a valid type definition.
@@ -14,6 +14,7 @@ Requirements:
 """
 
 import re
+import sys
 from typing import Any, Dict, List, Match, Optional, Tuple
 
 from autosar_pdf2txt.models import (
@@ -425,12 +426,15 @@ class AutosarClassParser(AbstractTypeParser):
 
         Requirements:
             SWR_PARSER_00021: Multi-Line Attribute Parsing for AutosarClass
+            SWR_PARSER_00038: Shared Type Name Strings
 
         Args:
             current_model: The current AutosarClass being parsed.
         """
         for section_name, (items, _, _) in self._pending_class_lists.items():
             if items:
+                # The same base and aggregating class names are listed by many classes
+                items = [sys.intern(item) for item in items]
                 if section_name == "base_classes":
                     # Split into regular bases and Atp interfaces
                     regular_bases = [item for item in items if not item.startswith("Atp")]
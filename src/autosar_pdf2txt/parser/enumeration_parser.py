@@ -41,6 +41,11 @@ class AutosarEnumerationParser(AbstractTypeParser):
         SWR_PARSER_00028: Direct Model Creation by Specialized Parsers
     """
 
+    # SWR_PARSER_00015: Enumeration Literal Extraction from PDF
+    # SWR_PARSER_00031: Enumeration Literal Tags Extraction
+    LITERAL_INDEX_PATTERN = re.compile(r"atp\.EnumerationLiteralIndex=(\d+)")
+    XML_NAME_PATTERN = re.compile(r"xml\.name=([^\s,]+)")
+
     def __init__(self) -> None:
         """Initialize the AutosarEnumeration parser.
 
@@ -629,8 +634,7 @@ class AutosarEnumerationParser(AbstractTypeParser):
             The index if found, None otherwise.
         """
         # Look for pattern like "atp.EnumerationLiteralIndex=0"
-        index_pattern = re.compile(r"atp\.EnumerationLiteralIndex=(\d+)")
-        match = index_pattern.search(description)
+        match = self.LITERAL_INDEX_PATTERN.search(description)
         if match:
             return int(match.group(1))
         return None
@@ -654,14 +658,12 @@ class AutosarEnumerationParser(AbstractTypeParser):
         tags = {}
 
         # Extract atp.EnumerationLiteralIndex
-        index_pattern = re.compile(r"atp\.EnumerationLiteralIndex=(\d+)")
-        index_match = index_pattern.search(description)
+        index_match = self.LITERAL_INDEX_PATTERN.search(description)
         if index_match:
             tags["atp.EnumerationLiteralIndex"] = index_match.group(1)
 
         # Extract xml.name
-        xml_pattern = re.compile(r"xml\.name=([^\s,]+)")
-        xml_match = xml_pattern.search(description)
+        xml_match = self.XML_NAME_PATTERN.search(description)
         if xml_match:
             tags["xml.name"] = xml_match.group(1)
 
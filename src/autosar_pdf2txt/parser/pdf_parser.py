@@ -17,13 +17,25 @@ Requirements:
     SWR_PARSER_00027: Parser Backward Compatibility
     SWR_PARSER_00031: ATP Interface Implementation Tracking
     SWR_PARSER_00032: ATP Interface Pure Interface Validation
+    SWR_PARSER_00036: Parallel PDF File Parsing
+    SWR_PARSER_00037: Persistent PDF Text Cache
 """
 
+import contextlib
+import hashlib
+import json
 import logging
+import multiprocessing
+import os
+import re
 import warnings
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from io import StringIO
+from itertools import repeat
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Union, cast
+from typing import Dict, List, Optional, Set, Tuple, Union, cast
 
 from autosar_pdf2txt.models import (
     AutosarClass,
@@ -35,12 +47,128 @@ from autosar_pdf2txt.models import (
 
 from autosar_pdf2txt.models.enums import ATPType
 
+from autosar_pdf2txt.parser.base_parser import AbstractTypeParser
 from autosar_pdf2txt.parser.class_parser import AutosarClassParser
 from autosar_pdf2txt.parser.enumeration_parser import AutosarEnumerationParser
 from autosar_pdf2txt.parser.primitive_parser import AutosarPrimitiveParser
 
 logger = logging.getLogger(__name__)
 
+# Version of the extracted text format stored in the persistent text cache.
+# Bump this whenever _extract_pdf_text() changes its output, so that cache
+# entries written by older versions are no longer used.
+_TEXT_CACHE_VERSION = b"autosar-pdf2txt-text-v1"
+
+
+def _extract_pdf_text(pdf_path: str) -> Tuple[str, List[int]]:
+    """Extract the text of all pages of a PDF into a single buffer.
+
+    Requirements:
+        SWR_PARSER_00009: Proper Word Spacing in PDF Text Extraction
+        SWR_PARSER_00030: Page Number Tracking in Two-Phase Parsing
+
+    Args:
+        pdf_path: Path to the PDF file.
+
+    Returns:
+        A tuple of (complete_text, line_to_page) where line_to_page maps
+        each line index of the text to its page number.
+    """
+    import pdfplumber
+
+    text_buffer = StringIO()
+    line_to_page: List[int] = []  # Maps line index to page number
+
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_num, page in enumerate(pdf.pages, start=1):
+            # Use extract_words() with x_tolerance=1 to properly extract words with spaces
+            # This fixes the issue where words are concatenated without spaces
+            words = page.extract_words(x_tolerance=1)
+
+            if words:
+                # Reconstruct text from words, preserving line breaks
+                # Group words by their vertical position (top coordinate)
+                current_y = None
+                for word in words:
+                    text = word['text']
+                    top = word['top']
+
+                    # Check if we've moved to a new line
+                    if current_y is not None and abs(top - current_y) > 5:
+                        text_buffer.write("\n")
+                        # Record the page number for this line
+                        line_to_page.append(page_num)
+
+                    text_buffer.write(text + " ")
+                    current_y = top
+
+                # Add newline after each page
+                text_buffer.write("\n")
+                line_to_page.append(page_num)
+
+    return text_buffer.getvalue(), line_to_page
+
+
+def _extract_pdf_text_with_disk_cache(pdf_path: str, cache_dir: str) -> Tuple[str, List[int]]:
+    """Extract the text of a PDF, reusing a result stored in cache_dir.
+
+    Cache files are named after a BLAKE2b digest of the PDF content, the
+    text format version and the installed pdfplumber and pdfminer.six
+    versions, so renamed or copied PDFs still hit the cache while changed
+    PDFs or upgraded backends never do. An unreadable cache file is ignored
+    and a cache file that cannot be written only produces a warning.
+
+    Requirements:
+        SWR_PARSER_00037: Persistent PDF Text Cache
+
+    Args:
+        pdf_path: Path to the PDF file.
+        cache_dir: Directory holding the cache files.
+
+    Returns:
+        A tuple of (complete_text, line_to_page).
+    """
+    import pdfminer
+    import pdfplumber
+
+    digest = hashlib.blake2b(_TEXT_CACHE_VERSION, digest_size=16)
+    # The extracted text also depends on the PDF backend versions
+    backend_versions = f"\0{pdfplumber.__version__}\0{getattr(pdfminer, '__version__', '')}\0"
+    digest.update(backend_versions.encode())
+    with open(pdf_path, "rb") as pdf_file:
+        for chunk in iter(lambda: pdf_file.read(1 << 20), b""):
+            digest.update(chunk)
+    cache_file = Path(cache_dir) / f"{digest.hexdigest()}.json"
+
+    try:
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        return cached["text"], list(cached["line_to_page"])
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable PDF text cache file '{cache_file}': {e}")
+
+    complete_text, line_to_page = _extract_pdf_text(pdf_path)
+
+    # Write to a temporary file first so that concurrent readers never see a
+    # partially written cache file
+    temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file.write_text(
+            json.dumps({"text": complete_text, "line_to_page": line_to_page}),
+            encoding="utf-8",
+        )
+        os.replace(temp_file, cache_file)
+    except OSError as e:
+        logger.warning(f"Failed to write PDF text cache file '{cache_file}': {e}")
+    finally:
+        # Never leave the temporary file behind if writing or replacing failed
+        with contextlib.suppress(OSError):
+            temp_file.unlink(missing_ok=True)
+
+    return complete_text, line_to_page
+
 
 class PdfParser:
     """Parse AUTOSAR PDF files to extract package and class hierarchies.
@@ -58,23 +186,44 @@ class PdfParser:
         >>> print(len(packages))
     """
 
-    def __init__(self) -> None:
+    # SWR_PARSER_00022: PDF Source Location Extraction
+    # "Part of AUTOSAR Standard: <StandardName>" or "Part of AUTOSAR Standard <StandardName>"
+    STANDARD_PATTERN = re.compile(r"Part of AUTOSAR Standard:?\s*(.+)")
+    # "Part of Standard Release: R<YY>-<MM>" or "Part of Standard Release R<YY>-<MM>"
+    RELEASE_PATTERN = re.compile(r"Part of Standard Release:?\s*(R\d{2}-\d{2})")
+
+    def __init__(self, cache_dir: str | Path | None = None) -> None:
         """Initialize the PDF parser.
 
         Requirements:
             SWR_PARSER_00001: PDF Parser Initialization
             SWR_PARSER_00007: PDF Backend Support - pdfplumber
+            SWR_PARSER_00037: Persistent PDF Text Cache
+
+        Args:
+            cache_dir: Optional directory in which the text extracted from
+                each PDF is stored and reused by later runs. Disabled by
+                default.
 
         Raises:
             ImportError: If pdfplumber is not installed.
         """
         self._validate_backend()
 
+        self._cache_dir = str(cache_dir) if cache_dir is not None else None
+
         # Instantiate specialized parsers
         self._class_parser = AutosarClassParser()
         self._enum_parser = AutosarEnumerationParser()
         self._primitive_parser = AutosarPrimitiveParser()
 
+        # Map parser types to parsers so continuation parsing is a single lookup
+        self._parsers: Dict[str, AbstractTypeParser] = {
+            "class": self._class_parser,
+            "primitive": self._primitive_parser,
+            "enumeration": self._enum_parser,
+        }
+
     def _validate_backend(self) -> None:
         """Validate that pdfplumber backend is available.
 
@@ -109,26 +258,27 @@ class PdfParser:
             A tuple of (autosar_standard, standard_release). Both values are
             Optional[str] and will be None if not found in the text.
         """
-        import re
-
         autosar_standard: Optional[str] = None
         standard_release: Optional[str] = None
 
-        # Pattern for AUTOSAR standard: "Part of AUTOSAR Standard: <StandardName>" or "Part of AUTOSAR Standard <StandardName>"
-        standard_pattern = re.compile(r"Part of AUTOSAR Standard:?\s*(.+)")
-        # Pattern for AUTOSAR release: "Part of Standard Release: R<YY>-<MM>" or "Part of Standard Release R<YY>-<MM>"
-        release_pattern = re.compile(r"Part of Standard Release:?\s*(R\d{2}-\d{2})")
-
         for line in text.split("\n"):
+            line = line.strip()
+
             # Try to match AUTOSAR standard
-            standard_match = standard_pattern.match(line.strip())
-            if standard_match and autosar_standard is None:
-                autosar_standard = standard_match.group(1).strip()
+            if autosar_standard is None:
+                standard_match = self.STANDARD_PATTERN.match(line)
+                if standard_match:
+                    autosar_standard = standard_match.group(1).strip()
 
             # Try to match AUTOSAR release
-            release_match = release_pattern.match(line.strip())
-            if release_match and standard_release is None:
-                standard_release = release_match.group(1).strip()
+            if standard_release is None:
+                release_match = self.RELEASE_PATTERN.match(line)
+                if release_match:
+                    standard_release = release_match.group(1).strip()
+
+            # Only the first occurrence of each is used
+            if autosar_standard is not None and standard_release is not None:
+                break
 
         return autosar_standard, standard_release
 
@@ -153,36 +303,71 @@ class PdfParser:
         """
         return self.parse_pdfs([pdf_path])
 
-    def parse_pdfs(self, pdf_paths: List[str]) -> AutosarDoc:
+    def parse_pdfs(self, pdf_paths: List[str], max_workers: int | None = 1) -> AutosarDoc:
         """Parse multiple PDF files and extract the complete package hierarchy.
 
         This method parses all PDFs first, then builds the package hierarchy and
         resolves parent/children relationships on the complete model. This ensures
         that parent classes are found even if they are defined in later PDFs.
 
+        The PDFs are independent of each other until the hierarchy is built, so
+        they can be parsed in separate worker processes. The models are always
+        merged in the order of pdf_paths, so the result does not depend on the
+        number of workers.
+
         Requirements:
             SWR_PARSER_00003: PDF File Parsing
             SWR_PARSER_00006: Package Hierarchy Building
     SWR_PARSER_00033: ATP Interface Tracking (parent resolution from implements)
 
             SWR_PARSER_00017: AUTOSAR Class Parent Resolution
+            SWR_PARSER_00036: Parallel PDF File Parsing
 
         Args:
             pdf_paths: List of paths to PDF files.
+            max_workers: Maximum number of worker processes used to parse the
+                PDFs. 1 (default) parses sequentially in the current process,
+                None uses one worker per available CPU. No more workers than
+                PDFs are started.
 
         Returns:
             AutosarDoc containing packages and root classes from all PDFs.
 
         Raises:
             FileNotFoundError: If any PDF file doesn't exist.
+            ValueError: If max_workers is less than 1.
             Exception: If PDF parsing fails.
         """
         # Phase 1: Extract all model objects from ALL PDFs first
         all_models: List[Union[AutosarClass, AutosarEnumeration, AutosarPrimitive]] = []
-        for i, pdf_path in enumerate(pdf_paths, 1):
-            logger.info(f"  [{i}/{len(pdf_paths)}] 📄 {pdf_path}")
-            models = self._extract_models(pdf_path)
-            all_models.extend(models)
+        total = len(pdf_paths)
+        workers = _resolve_worker_count(max_workers, total)
+        if workers == 1:
+            for i, pdf_path in enumerate(pdf_paths, 1):
+                logger.info(f"  [{i}/{total}] 📄 {pdf_path}")
+                models = self._extract_models(pdf_path)
+                all_models.extend(models)
+        else:
+            # SWR_PARSER_00036: Parse PDFs in worker processes, merge in input order
+            logger.info(f"  ⚙️  Using {workers} worker processes")
+            # Workers do not inherit the logging configuration under the spawn and
+            # forkserver start methods, so they send their log records back here
+            log_queue: multiprocessing.Queue[logging.LogRecord] = multiprocessing.Queue()
+            listener = QueueListener(log_queue, _WorkerLogDispatcher())
+            listener.start()
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker_logging,
+                    initargs=(log_queue, _configured_log_levels()),
+                ) as executor:
+                    results = executor.map(_extract_models_in_worker, pdf_paths, repeat(self._cache_dir))
+                    for i, (pdf_path, models) in enumerate(zip(pdf_paths, results), 1):
+                        logger.info(f"  [{i}/{total}] 📄 {pdf_path}")
+                        all_models.extend(models)
+            finally:
+                listener.stop()
+                log_queue.close()
 
         # Phase 2: Build complete package hierarchy once
         return self._build_package_hierarchy(all_models)
@@ -220,8 +405,6 @@ class PdfParser:
         Returns:
             List of model objects with source information.
         """
-        import pdfplumber
-
         models: List[Union[AutosarClass, AutosarEnumeration, AutosarPrimitive]] = []
 
         # Extract PDF filename for source tracking
@@ -234,58 +417,46 @@ class PdfParser:
             warnings.filterwarnings("ignore", category=UserWarning, module="pdfplumber")
 
             try:
-                with pdfplumber.open(pdf_path) as pdf:
-                    # Phase 1: Extract all text from all pages into a single buffer
-                    # SWR_PARSER_00030: Track line-to-page mapping for accurate page number tracking
-                    text_buffer = StringIO()
-                    line_to_page: List[int] = []  # Maps line index to page number
-                    
-                    for page_num, page in enumerate(pdf.pages, start=1):
-                        # Use extract_words() with x_tolerance=1 to properly extract words with spaces
-                        # This fixes the issue where words are concatenated without spaces
-                        words = page.extract_words(x_tolerance=1)
-
-                        if words:
-                            # Reconstruct text from words, preserving line breaks
-                            # Group words by their vertical position (top coordinate)
-                            current_y = None
-                            for word in words:
-                                text = word['text']
-                                top = word['top']
-
-                                # Check if we've moved to a new line
-                                if current_y is not None and abs(top - current_y) > 5:
-                                    text_buffer.write("\n")
-                                    # Record the page number for this line
-                                    line_to_page.append(page_num)
-
-                                text_buffer.write(text + " ")
-                                current_y = top
-
-                            # Add newline after each page
-                            text_buffer.write("\n")
-                            line_to_page.append(page_num)
-
-                    # Phase 2: Parse the complete text at once
-                    complete_text = text_buffer.getvalue()
-                    
-                    # Parse all text with state management for multi-page definitions
-                    current_models: Dict[int, Union[AutosarClass, AutosarEnumeration, AutosarPrimitive]] = {}
-                    model_parsers: Dict[int, str] = {}  # Maps model index to parser type
-                    
-                    models = self._parse_complete_text(
-                        complete_text,
-                        pdf_filename=pdf_filename,
-                        current_models=current_models,
-                        model_parsers=model_parsers,
-                        line_to_page=line_to_page,
-                    )
+                # Phase 1: Extract all text from all pages into a single buffer
+                # SWR_PARSER_00030: Track line-to-page mapping for accurate page number tracking
+                # SWR_PARSER_00037: Reuse the text stored in the cache directory if enabled
+                complete_text, line_to_page = self._read_pdf_text(pdf_path)
+
+                # Phase 2: Parse the complete text at once
+                # Parse all text with state management for multi-page definitions
+                current_models: Dict[int, Union[AutosarClass, AutosarEnumeration, AutosarPrimitive]] = {}
+                model_parsers: Dict[int, str] = {}  # Maps model index to parser type
+
+                models = self._parse_complete_text(
+                    complete_text,
+                    pdf_filename=pdf_filename,
+                    current_models=current_models,
+                    model_parsers=model_parsers,
+                    line_to_page=line_to_page,
+                )
 
             except Exception as e:
                 raise Exception(f"Failed to parse PDF with pdfplumber: {e}") from e
 
         return models
 
+    def _read_pdf_text(self, pdf_path: str) -> Tuple[str, List[int]]:
+        """Read the text of a PDF, through the cache directory if one is set.
+
+        Requirements:
+            SWR_PARSER_00030: Page Number Tracking in Two-Phase Parsing
+            SWR_PARSER_00037: Persistent PDF Text Cache
+
+        Args:
+            pdf_path: Path to the PDF file.
+
+        Returns:
+            A tuple of (complete_text, line_to_page).
+        """
+        if self._cache_dir is not None:
+            return _extract_pdf_text_with_disk_cache(pdf_path, self._cache_dir)
+        return _extract_pdf_text(pdf_path)
+
     def _parse_complete_text(
         self,
         text: str,
@@ -383,21 +554,13 @@ class PdfParser:
                     # Continue parsing the existing model
                     assert existing_model_index is not None
                     parser_type = model_parsers[existing_model_index]
+                    type_parser = self._parsers[parser_type]
                     i += 1
                     is_complete = False
                     while i < len(lines):
-                        if parser_type == "class":
-                            new_i, is_complete = self._class_parser.continue_parsing(
-                                existing_model, lines, i
-                            )
-                        elif parser_type == "primitive":
-                            new_i, is_complete = self._primitive_parser.continue_parsing(
-                                existing_model, lines, i
-                            )
-                        else:  # enumeration
-                            new_i, is_complete = self._enum_parser.continue_parsing(
-                                existing_model, lines, i
-                            )
+                        new_i, is_complete = type_parser.continue_parsing(
+                            existing_model, lines, i
+                        )
 
                         i = new_i
 
@@ -455,21 +618,13 @@ class PdfParser:
                     models.append(new_model)
 
                     # Continue parsing with this model
+                    # Use the appropriate parser to continue parsing
+                    type_parser = self._parsers[parser_type]
                     i += 1
                     while i < len(lines):
-                        # Use the appropriate parser to continue parsing
-                        if parser_type == "class":
-                            new_i, is_complete = self._class_parser.continue_parsing(
-                                new_model, lines, i
-                            )
-                        elif parser_type == "primitive":
-                            new_i, is_complete = self._primitive_parser.continue_parsing(
-                                new_model, lines, i
-                            )
-                        else:  # enumeration
-                            new_i, is_complete = self._enum_parser.continue_parsing(
-                                new_model, lines, i
-                            )
+                        new_i, is_complete = type_parser.continue_parsing(
+                            new_model, lines, i
+                        )
 
                         i = new_i
 
@@ -485,20 +640,9 @@ class PdfParser:
             # Try to continue parsing existing models
             if current_models:
                 for model_index, current_model in list(current_models.items()):
-                    parser_type = model_parsers[model_index]
-                    
-                    if parser_type == "class":
-                        new_i, is_complete = self._class_parser.continue_parsing(
-                            current_model, lines, i
-                        )
-                    elif parser_type == "primitive":
-                        new_i, is_complete = self._primitive_parser.continue_parsing(
-                            current_model, lines, i
-                        )
-                    else:  # enumeration
-                        new_i, is_complete = self._enum_parser.continue_parsing(
-                            current_model, lines, i
-                        )
+                    new_i, is_complete = self._parsers[model_parsers[model_index]].continue_parsing(
+                        current_model, lines, i
+                    )
 
                     i = new_i
 
@@ -549,12 +693,7 @@ class PdfParser:
             )
 
             # Add model to package
-            if isinstance(model, AutosarClass):
-                current_pkg.add_type(model)
-            elif isinstance(model, AutosarEnumeration):
-                current_pkg.add_type(model)
-            elif isinstance(model, AutosarPrimitive):
-                current_pkg.add_type(model)
+            current_pkg.add_type(model)
 
         # Collect root packages (those that are not subpackages of any other package)
         all_subpackages: set[str] = set()
@@ -831,12 +970,10 @@ class PdfParser:
             packages: List of all packages.
         """
         # Build a parent-to-children mapping (O(n) complexity)
-        parent_to_children: Dict[str, List[str]] = {}
+        parent_to_children: Dict[str, List[str]] = defaultdict(list)
         for pkg in packages:
             for typ in pkg.types:
                 if isinstance(typ, AutosarClass) and typ.parent:
-                    if typ.parent not in parent_to_children:
-                        parent_to_children[typ.parent] = []
                     parent_to_children[typ.parent].append(typ.name)
         
         # Populate children lists using the mapping
@@ -863,19 +1000,19 @@ class PdfParser:
         Returns:
             Dictionary mapping ATP interface names to lists of implementing class names.
         """
-        interface_map: Dict[str, List[str]] = {}
+        interface_map: Dict[str, List[str]] = defaultdict(list)
 
         for pkg in packages:
             for typ in pkg.types:
                 if isinstance(typ, AutosarClass):
                     # For each class that implements ATP interfaces
                     for interface_name in typ.implements:
-                        if interface_name not in interface_map:
-                            interface_map[interface_name] = []
-                        if typ.name not in interface_map[interface_name]:
-                            interface_map[interface_name].append(typ.name)
+                        implementers = interface_map[interface_name]
+                        if typ.name not in implementers:
+                            implementers.append(typ.name)
 
-        return interface_map
+        # Hand back a plain dict so lookups of unknown interfaces never insert keys
+        return dict(interface_map)
 
     def _update_interface_implementers(
         self, packages: List[AutosarPackage], interface_map: Dict[str, List[str]]
@@ -1160,4 +1297,133 @@ class PdfParser:
                         direct_parent = candidate_name
 
                 if direct_parent:
-                    typ.parent = direct_parent
\ No newline at end of file
+                    typ.parent = direct_parent
+
+
+def _available_cpu_count() -> int:
+    """Return the number of CPUs this process may run on.
+
+    Uses the CPU affinity mask where available, so container and cgroup
+    CPU limits are respected, and falls back to os.cpu_count().
+
+    Requirements:
+        SWR_PARSER_00036: Parallel PDF File Parsing
+
+    Returns:
+        The number of usable CPUs, at least 1.
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - not available on Windows/macOS
+        return os.cpu_count() or 1
+
+
+def _resolve_worker_count(max_workers: int | None, pdf_count: int) -> int:
+    """Determine the number of worker processes for parsing PDFs.
+
+    Requirements:
+        SWR_PARSER_00036: Parallel PDF File Parsing
+
+    Args:
+        max_workers: Requested maximum number of workers, or None for one
+            worker per available CPU.
+        pdf_count: Number of PDFs to parse.
+
+    Returns:
+        The number of workers to use, at least 1 and at most pdf_count.
+
+    Raises:
+        ValueError: If max_workers is less than 1.
+    """
+    if max_workers is None:
+        max_workers = _available_cpu_count()
+    elif max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+    return max(1, min(max_workers, pdf_count))
+
+
+def _configured_log_levels() -> Dict[str, int]:
+    """Return the levels set on the root logger and on named loggers.
+
+    Requirements:
+        SWR_PARSER_00036: Parallel PDF File Parsing
+
+    Returns:
+        Dictionary mapping logger names to their levels, with the root
+        logger under its name "root".
+    """
+    root_logger = logging.getLogger()
+    levels = {root_logger.name: root_logger.level}
+    for name, named_logger in root_logger.manager.loggerDict.items():
+        if isinstance(named_logger, logging.Logger) and named_logger.level != logging.NOTSET:
+            levels[name] = named_logger.level
+    return levels
+
+
+def _init_worker_logging(log_queue: "multiprocessing.Queue[logging.LogRecord]", levels: Dict[str, int]) -> None:
+    """Send the log records of a worker process to the parsing process.
+
+    Used as the initializer of the worker processes. The logger levels of the
+    parsing process are applied so that records are filtered as they would be
+    there, and the root handlers are replaced by a queue handler so that
+    records reach the handlers configured by the parsing process (e.g. the
+    CLI console and log files) exactly once.
+
+    Requirements:
+        SWR_PARSER_00036: Parallel PDF File Parsing
+
+    Args:
+        log_queue: Queue read by the parsing process.
+        levels: Logger levels of the parsing process by logger name.
+    """
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(QueueHandler(log_queue))
+    for name, level in levels.items():
+        logging.getLogger(name).setLevel(level)
+
+
+class _WorkerLogDispatcher(logging.Handler):
+    """Hand log records received from worker processes to their loggers.
+
+    The records were already filtered by level in the workers, so they are
+    passed to the handlers of the logger they were logged to, including
+    propagation to the root handlers, as if they had been logged here.
+
+    Requirements:
+        SWR_PARSER_00036: Parallel PDF File Parsing
+    """
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Dispatch a record to the logger named in it.
+
+        Args:
+            record: Log record received from a worker process.
+
+        Returns:
+            Always True, the record is never filtered here.
+        """
+        logging.getLogger(record.name).handle(record)
+        return True
+
+
+def _extract_models_in_worker(
+    pdf_path: str, cache_dir: str | None = None
+) -> List[AutosarClass | AutosarEnumeration | AutosarPrimitive]:
+    """Extract the models of one PDF in a worker process.
+
+    Module-level so it can be sent to a ProcessPoolExecutor; each call uses
+    its own PdfParser because the specialized parsers keep parsing state.
+
+    Requirements:
+        SWR_PARSER_00036: Parallel PDF File Parsing
+
+    Args:
+        pdf_path: Path to the PDF file.
+        cache_dir: Optional directory of the persistent text cache.
+
+    Returns:
+        List of model objects parsed from the PDF.
+    """
+    return PdfParser(cache_dir=cache_dir)._extract_models(pdf_path)
@@ -0,0 +1,12 @@
+"""File name helpers shared by the AUTOSAR writers.
+
+Requirements:
+    SWR_WRITER_00005: Directory-Based Class File Output
+    SWR_WRITER_00012: JSON File Naming and Sanitization
+"""
+
+import re
+
+# Characters that are invalid in file names on Windows and other
+# operating systems: < > : " / \ | ? * and control characters
+INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
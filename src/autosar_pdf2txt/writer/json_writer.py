@@ -1,11 +1,20 @@
 """JSON writer for AUTOSAR packages and classes."""
 
 import json
+import re
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import ClassVar, Dict, List, Optional, Union
 
-from autosar_pdf2txt.models import AutosarPackage, AutosarClass, AutosarEnumeration, AutosarPrimitive, ATPType
+from autosar_pdf2txt.models import (
+    ATPType,
+    AttributeKind,
+    AutosarClass,
+    AutosarEnumeration,
+    AutosarPackage,
+    AutosarPrimitive,
+)
+from autosar_pdf2txt.writer.filenames import INVALID_FILENAME_CHARS
 
 
 class JsonWriter:
@@ -27,6 +36,22 @@ class JsonWriter:
     invalid characters (< > : " / \\ | ? *) with underscores.
     """
 
+    _REPEATED_UNDERSCORES = re.compile(r"_+")
+
+    # JSON names of the attribute kinds
+    _ATTRIBUTE_KIND_NAMES: ClassVar[Dict[AttributeKind, str]] = {
+        AttributeKind.ATTR: "attribute",
+        AttributeKind.REF: "reference",
+    }
+
+    # JSON names of the ATP markers; classes without a marker have none
+    _ATP_TYPE_NAMES: ClassVar[Dict[ATPType, str]] = {
+        ATPType.ATP_VARIATION: "atpVariation",
+        ATPType.ATP_MIXED_STRING: "atpMixedString",
+        ATPType.ATP_MIXED: "atpMixed",
+        ATPType.ATP_PROTO: "atpPrototype",
+    }
+
     def __init__(self) -> None:
         """Initialize the JSON writer.
 
@@ -267,22 +292,15 @@ class JsonWriter:
             >>> writer._sanitize_filename("M2::AUTOSAR::DataTypes")
             'M2_AUTOSAR_DataTypes'
         """
-        import re
-
         # Replace :: delimiter with single underscore
         sanitized = name.replace("::", "_")
 
         # Replace other invalid filename characters with underscores
         # Invalid chars: < > : " / \ | ? * and control characters
-        # Note: using \\ in pattern to match literal backslash
-        invalid_chars = r'[<>:"/|?*\x00-\x1f]'
-        # First handle backslash separately since it's tricky in regex
-        sanitized = sanitized.replace("\\", "_")
-        # Then replace all other invalid characters
-        sanitized = re.sub(invalid_chars, "_", sanitized)
+        sanitized = INVALID_FILENAME_CHARS.sub("_", sanitized)
 
         # Collapse multiple underscores into single underscore
-        sanitized = re.sub(r"_+", "_", sanitized)
+        sanitized = self._REPEATED_UNDERSCORES.sub("_", sanitized)
 
         # Ensure name doesn't start or end with spaces or dots
         sanitized = sanitized.strip(". ")
@@ -305,17 +323,7 @@ class JsonWriter:
         Returns:
             String value or None if ATPType.NONE.
         """
-        if atp_type == ATPType.NONE:
-            return None
-        elif atp_type == ATPType.ATP_VARIATION:
-            return "atpVariation"
-        elif atp_type == ATPType.ATP_MIXED_STRING:
-            return "atpMixedString"
-        elif atp_type == ATPType.ATP_MIXED:
-            return "atpMixed"
-        elif atp_type == ATPType.ATP_PROTO:
-            return "atpPrototype"
-        return None
+        return self._ATP_TYPE_NAMES.get(atp_type)
 
     def _serialize_source(self, source) -> Dict:
         """Serialize AutosarDocumentSource to dictionary.
@@ -348,17 +356,10 @@ class JsonWriter:
         Returns:
             Dictionary with attribute information.
         """
-        from autosar_pdf2txt.models import AttributeKind
-
-        kind_map = {
-            AttributeKind.ATTR: "attribute",
-            AttributeKind.REF: "reference"
-        }
-
         return {
             "type": attr.type,
             "multiplicity": attr.multiplicity,
-            "kind": kind_map.get(attr.kind, "attribute"),
+            "kind": self._ATTRIBUTE_KIND_NAMES.get(attr.kind, "attribute"),
             "is_ref": attr.is_ref,
             "note": attr.note
         }
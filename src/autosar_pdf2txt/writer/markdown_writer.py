@@ -1,11 +1,17 @@
 """Markdown writer for AUTOSAR packages and classes."""
 
-import re
 from io import StringIO
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
-from autosar_pdf2txt.models import ATPType, AutosarClass, AutosarEnumeration, AutosarPackage
+from autosar_pdf2txt.models import (
+    ATPType,
+    AutosarClass,
+    AutosarDocumentSource,
+    AutosarEnumeration,
+    AutosarPackage,
+)
+from autosar_pdf2txt.writer.filenames import INVALID_FILENAME_CHARS
 
 
 class MarkdownWriter:
@@ -29,6 +35,13 @@ class MarkdownWriter:
     The abstract status is only shown in individual class files.
     """
 
+    # Header and separator rows of the document source table, shared by
+    # class and enumeration files
+    _SOURCE_TABLE_HEADER = (
+        "| PDF File | Page | AUTOSAR Standard | Standard Release |\n"
+        "|----------|------|------------------|------------------|\n"
+    )
+
     def __init__(self) -> None:
         """Initialize the markdown writer.
 
@@ -428,19 +441,7 @@ class MarkdownWriter:
 
         # Write source section if available
         if cls.sources:
-            output.write("## Document Source\n\n")
-            # Table header with clickable source links
-            output.write("| PDF File | Page | AUTOSAR Standard | Standard Release |\n")
-            output.write("|----------|------|------------------|------------------|\n")
-            # Sort sources by PDF filename
-            for source in sorted(cls.sources, key=lambda s: s.pdf_file):
-                autosar_standard = source.autosar_standard if source.autosar_standard else "-"
-                standard_release = source.standard_release if source.standard_release else "-"
-                # Create clickable link to PDF with page anchor
-                # Format: [filename#page=N](filename.pdf#page=N)
-                source_link = f"[{source.pdf_file}#page={source.page_number}]({source.pdf_file}#page={source.page_number})"
-                output.write(f"| {source_link} | {source.page_number} | {autosar_standard} | {standard_release} |\n")
-            output.write("\n")
+            self._write_source_table(cls.sources, output)
 
         # Write children if present (NOT for ATP interfaces)
         if cls.children and cls.atp_type == ATPType.NONE:
@@ -525,19 +526,7 @@ class MarkdownWriter:
 
         # Write source if available
         if enum.sources:
-            output.write("## Document Source\n\n")
-            # Table header with clickable source links
-            output.write("| PDF File | Page | AUTOSAR Standard | Standard Release |\n")
-            output.write("|----------|------|------------------|------------------|\n")
-            # Sort sources by PDF filename
-            for source in sorted(enum.sources, key=lambda s: s.pdf_file):
-                autosar_standard = source.autosar_standard if source.autosar_standard else "-"
-                standard_release = source.standard_release if source.standard_release else "-"
-                # Create clickable link to PDF with page anchor
-                # Format: [filename#page=N](filename.pdf#page=N)
-                source_link = f"[{source.pdf_file}#page={source.page_number}]({source.pdf_file}#page={source.page_number})"
-                output.write(f"| {source_link} | {source.page_number} | {autosar_standard} | {standard_release} |\n")
-            output.write("\n")
+            self._write_source_table(enum.sources, output)
 
         # Write note if present
         if enum.note:
@@ -572,6 +561,32 @@ class MarkdownWriter:
         file_path = pkg_dir / f"{sanitized_name}.md"
         file_path.write_text(output.getvalue(), encoding="utf-8")
 
+    def _write_source_table(
+        self, sources: List[AutosarDocumentSource], output: StringIO
+    ) -> None:
+        """Write the document source section of a class or enumeration file.
+
+        Requirements:
+            SWR_MODEL_00027: AUTOSAR Source Location Representation
+            SWR_WRITER_00008: Markdown Source Information Output
+
+        Args:
+            sources: The sources of the type, in any order.
+            output: StringIO buffer to write to.
+        """
+        output.write("## Document Source\n\n")
+        # Table header with clickable source links
+        output.write(self._SOURCE_TABLE_HEADER)
+        # Sort sources by PDF filename
+        for source in sorted(sources, key=lambda s: s.pdf_file):
+            autosar_standard = source.autosar_standard if source.autosar_standard else "-"
+            standard_release = source.standard_release if source.standard_release else "-"
+            # Create clickable link to PDF with page anchor
+            # Format: [filename#page=N](filename.pdf#page=N)
+            source_link = f"[{source.pdf_file}#page={source.page_number}]({source.pdf_file}#page={source.page_number})"
+            output.write(f"| {source_link} | {source.page_number} | {autosar_standard} | {standard_release} |\n")
+        output.write("\n")
+
     def _sanitize_filename(self, name: str) -> str:
         """Sanitize a class name for use as a filename.
 
@@ -595,14 +610,9 @@ class MarkdownWriter:
             >>> writer._sanitize_filename("NormalClass")
             'NormalClass'
         """
-        # Replace invalid filename characters with underscores
+        # Replace invalid filename characters with underscores in one pass
         # Invalid chars: < > : " / \ | ? * and control characters
-        # Note: using \\ in pattern to match literal backslash
-        invalid_chars = r'[<>:"/|?*\x00-\x1f]'
-        # First handle backslash separately since it's tricky in regex
-        sanitized = name.replace('\\', '_')
-        # Then replace all other invalid characters
-        sanitized = re.sub(invalid_chars, '_', sanitized)
+        sanitized = INVALID_FILENAME_CHARS.sub('_', name)
 
         # Ensure name doesn't start or end with spaces or dots
         sanitized = sanitized.strip('. ')
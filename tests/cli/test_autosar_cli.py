@@ -5,7 +5,7 @@ Test coverage for autosar_cli.py targeting 100%.
 
 from unittest.mock import MagicMock, PropertyMock, patch
 
-from autosar_pdf2txt.cli.autosar_cli import main
+from autosar_pdf2txt.cli.autosar_cli import infer_format_from_path, main
 from autosar_pdf2txt.models import AutosarDoc
 
 
@@ -591,3 +591,98 @@ class TestAutosarCli:
             assert call_args is not None
             format_string = call_args[0][0] if call_args[0] else call_args[1].get('fmt')
             assert "%(asctime)s" in format_string or "%(msecs)" in format_string
+
+    @patch("sys.argv", ["autosar-extract", "test.pdf", "-j", "0"])
+    @patch("autosar_pdf2txt.cli.autosar_cli.Path")
+    @patch("autosar_pdf2txt.cli.autosar_cli.logging")
+    def test_jobs_flag_passes_worker_count(self, mock_logging: MagicMock, mock_path: MagicMock) -> None:
+        """SWUT_CLI_00017: Test CLI -j/--jobs flag selects parallel parsing.
+
+        Requirements:
+            SWR_CLI_00015: CLI Parallel Parsing Option
+        """
+        mock_path_instance = MagicMock()
+        mock_path_instance.exists.return_value = True
+        mock_path_instance.is_file.return_value = True
+        type(mock_path_instance).suffix = PropertyMock(return_value=".pdf")
+        mock_path.return_value = mock_path_instance
+
+        with patch("autosar_pdf2txt.cli.autosar_cli.PdfParser") as mock_parser, \
+             patch("autosar_pdf2txt.cli.autosar_cli.MarkdownWriter") as mock_writer, \
+             patch("builtins.print"):
+            mock_doc = MagicMock(spec=AutosarDoc)
+            mock_doc.packages = []
+            mock_doc.root_classes = []
+            mock_parser.return_value.parse_pdfs.return_value = mock_doc
+            mock_writer.return_value.write_packages.return_value = ""
+
+            result = main()
+
+            assert result == 0
+            # 0 jobs means one worker per available CPU
+            _, kwargs = mock_parser.return_value.parse_pdfs.call_args
+            assert kwargs["max_workers"] is None
+
+    @patch("sys.argv", ["autosar-extract", "test.pdf", "--jobs", "-2"])
+    @patch("autosar_pdf2txt.cli.autosar_cli.Path")
+    @patch("autosar_pdf2txt.cli.autosar_cli.logging")
+    def test_jobs_flag_rejects_negative_value(self, mock_logging: MagicMock, mock_path: MagicMock) -> None:
+        """SWUT_CLI_00018: Test CLI rejects a negative -j/--jobs value.
+
+        Requirements:
+            SWR_CLI_00009: CLI Error Handling
+            SWR_CLI_00015: CLI Parallel Parsing Option
+        """
+        mock_path_instance = MagicMock()
+        mock_path_instance.exists.return_value = True
+        mock_path_instance.is_file.return_value = True
+        type(mock_path_instance).suffix = PropertyMock(return_value=".pdf")
+        mock_path.return_value = mock_path_instance
+
+        with patch("autosar_pdf2txt.cli.autosar_cli.PdfParser") as mock_parser:
+            result = main()
+
+            assert result == 1
+            mock_logging.getLogger.return_value.error.assert_called()
+            mock_parser.return_value.parse_pdfs.assert_not_called()
+
+    @patch("sys.argv", ["autosar-extract", "test.pdf", "--cache-dir", "cache"])
+    @patch("autosar_pdf2txt.cli.autosar_cli.Path")
+    @patch("autosar_pdf2txt.cli.autosar_cli.logging")
+    def test_cache_dir_flag_passed_to_parser(self, mock_logging: MagicMock, mock_path: MagicMock) -> None:
+        """SWUT_CLI_00019: Test CLI --cache-dir option enables the PDF text cache.
+
+        Requirements:
+            SWR_CLI_00016: CLI PDF Text Cache Option
+        """
+        mock_path_instance = MagicMock()
+        mock_path_instance.exists.return_value = True
+        mock_path_instance.is_file.return_value = True
+        type(mock_path_instance).suffix = PropertyMock(return_value=".pdf")
+        mock_path.return_value = mock_path_instance
+
+        with patch("autosar_pdf2txt.cli.autosar_cli.PdfParser") as mock_parser, \
+             patch("autosar_pdf2txt.cli.autosar_cli.MarkdownWriter") as mock_writer, \
+             patch("builtins.print"):
+            mock_doc = MagicMock(spec=AutosarDoc)
+            mock_doc.packages = []
+            mock_doc.root_classes = []
+            mock_parser.return_value.parse_pdfs.return_value = mock_doc
+            mock_writer.return_value.write_packages.return_value = ""
+
+            result = main()
+
+            assert result == 0
+            mock_parser.assert_called_once_with(cache_dir="cache")
+
+    def test_infer_format_from_path(self) -> None:
+        """SWUT_CLI_00020: Test output format inference from the file extension.
+
+        Requirements:
+            SWR_WRITER_00023: JSON Format Inference from Extension
+        """
+        assert infer_format_from_path("output.json") == "json"
+        assert infer_format_from_path("output.JSON") == "json"
+        assert infer_format_from_path("docs/output.md") == "markdown"
+        assert infer_format_from_path("output.txt") is None
+        assert infer_format_from_path(None) is None
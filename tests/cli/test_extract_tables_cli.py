@@ -139,6 +139,18 @@ class TestIsAutosarTable:
         # This should still match because "package" is a substring of "packageable"
         assert is_autosar_table(table) is True
 
+    def test_is_autosar_table_does_not_match_across_cells(self) -> None:
+        """SWUT_CLI_00013: Test a field name split over two header cells does not match.
+
+        Requirements:
+            SWR_CLI_00013: CLI Table Extraction
+        """
+        table = [
+            ["Cla", "ss", "Package", "Type"],
+            ["Test", "Class", "TestPackage", "string"],
+        ]
+        assert is_autosar_table(table) is False
+
 
 class TestExtractTablesFromPdf:
     """Tests for extract_tables_from_pdf function.
@@ -171,12 +183,14 @@ class TestExtractTablesFromPdf:
             ["testAttr", "string", "0..1"],
         ]
 
-        mock_page.extract_tables.return_value = [autosar_table, non_autosar_table]
-
         # Mock table finding
-        mock_table = MagicMock()
-        mock_table.bbox = (0, 0, 100, 100)
-        mock_page.find_tables.return_value = [mock_table, mock_table]
+        mock_autosar_table = MagicMock()
+        mock_autosar_table.bbox = (0, 0, 100, 100)
+        mock_autosar_table.extract.return_value = autosar_table
+        mock_non_autosar_table = MagicMock()
+        mock_non_autosar_table.bbox = (0, 100, 100, 200)
+        mock_non_autosar_table.extract.return_value = non_autosar_table
+        mock_page.find_tables.return_value = [mock_autosar_table, mock_non_autosar_table]
 
         # Mock image
         mock_img = MagicMock()
@@ -196,6 +210,9 @@ class TestExtractTablesFromPdf:
         assert len(result) == 1
         # Should save image for AUTOSAR table only
         assert mock_img.save.call_count == 1
+        # Should detect the tables on the page only once
+        mock_page.find_tables.assert_called_once()
+        mock_page.extract_tables.assert_not_called()
 
     @patch("autosar_pdf2txt.cli.extract_tables_cli.pdfplumber")
     @patch("autosar_pdf2txt.cli.extract_tables_cli.Path")
@@ -214,8 +231,9 @@ class TestExtractTablesFromPdf:
             ["testAttr", "string", "0..1"],
         ]
 
-        mock_page.extract_tables.return_value = [non_autosar_table]
-        mock_page.find_tables.return_value = []
+        mock_table = MagicMock()
+        mock_table.extract.return_value = non_autosar_table
+        mock_page.find_tables.return_value = [mock_table]
 
         mock_pdf.pages = [mock_page]
         mock_pdfplumber.open.return_value.__enter__.return_value = mock_pdf
@@ -260,11 +278,9 @@ class TestExtractTablesFromPdf:
             ["TestClass", "TestPackage", "testAttr"],
         ]
 
-        mock_page1.extract_tables.return_value = [autosar_table]
-        mock_page2.extract_tables.return_value = [autosar_table]
-
         mock_table = MagicMock()
         mock_table.bbox = (0, 0, 100, 100)
+        mock_table.extract.return_value = autosar_table
         mock_page1.find_tables.return_value = [mock_table]
         mock_page2.find_tables.return_value = [mock_table]
 
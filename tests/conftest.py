@@ -0,0 +1,24 @@
+"""Pytest configuration and fixtures shared by all tests."""
+
+from collections.abc import Callable
+
+import pytest
+
+
+@pytest.fixture
+def distinct_str() -> Callable[[str], str]:
+    """Provide a function that copies a string into a new string object.
+
+    String literals with the same value are shared by the compiler, so tests
+    of string interning use this to start from distinct but equal objects.
+
+    Returns:
+        Function returning an equal string that is not the given object.
+    """
+
+    def copy(value: str) -> str:
+        result = value.encode().decode()
+        assert result == value and result is not value
+        return result
+
+    return copy
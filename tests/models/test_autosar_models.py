@@ -3,6 +3,8 @@
 Test coverage for autosar_models.py targeting 100%.
 """
 
+import pickle
+
 import pytest
 
 from autosar_pdf2txt.models import (
@@ -11,6 +13,7 @@ from autosar_pdf2txt.models import (
     AutosarAttribute,
     AutosarClass,
     AutosarDoc,
+    AutosarDocumentSource,
     AutosarEnumLiteral,
     AutosarEnumeration,
     AutosarPackage,
@@ -453,6 +456,26 @@ class TestAutosarAttribute:
         assert "kind=AttributeKind.AGGR" in result
         assert "note='Test'" in result
 
+    def test_shared_attribute_strings(self, distinct_str) -> None:
+        """Test that equal attribute and literal strings share one string object.
+
+        Requirements:
+            SWR_MODEL_00034: Shared Name and Package Path Strings
+        """
+        first = AutosarAttribute(
+            distinct_str("dataReadPort"), distinct_str("dataType"), False, distinct_str("0..1"), AttributeKind.ATTR, "First"
+        )
+        second = AutosarAttribute(
+            distinct_str("dataReadPort"), distinct_str("dataType"), True, distinct_str("0..1"), AttributeKind.AGGR, "Second"
+        )
+        literal = AutosarEnumLiteral(distinct_str("dataReadPort"))
+
+        assert first.multiplicity == "0..1"
+        assert first.name is second.name
+        assert first.type is second.type
+        assert first.multiplicity is second.multiplicity
+        assert literal.name is first.name
+
 
 class TestAutosarClass:
     """Tests for AutosarClass class.
@@ -1067,6 +1090,46 @@ class TestAutosarClass:
         assert "Subclass3" in cls.subclasses
         assert "Subclass1" not in cls.subclasses
 
+    def test_slotted_instance(self) -> None:
+        """Test that class instances use slots and survive pickling.
+
+        Requirements:
+            SWR_MODEL_00032: Slotted Model Instances
+        """
+        source = AutosarDocumentSource("AUTOSAR_CP_TPS_Test.pdf", 42)
+        cls = AutosarClass(name="DerivedClass", package="M2::Test", bases=["BaseClass"], sources=[source])
+        assert not hasattr(cls, "__dict__")
+        with pytest.raises(AttributeError):
+            cls.unknown_field = "value"  # type: ignore[attr-defined]
+        # Every field is held in exactly one slot along the class hierarchy
+        declared = [slot for klass in type(cls).__mro__ for slot in vars(klass).get("__slots__", ())]
+        assert sorted(declared) == sorted(set(declared))
+        assert "name" in declared
+
+        restored = pickle.loads(pickle.dumps(cls))
+        assert restored.name == "DerivedClass"
+        assert restored.package == "M2::Test"
+        assert restored.bases == ["BaseClass"]
+        assert restored.sources == [source]
+        assert restored == cls
+
+    def test_shared_name_and_package_strings(self, distinct_str) -> None:
+        """Test that equal names and package paths share one string object.
+
+        Requirements:
+            SWR_MODEL_00034: Shared Name and Package Path Strings
+        """
+        package = "M2::AUTOSARTemplates::SWComponentTemplate"
+        first = AutosarClass(name=distinct_str("SwComponentType"), package=distinct_str(package), is_abstract=True)
+        second = AutosarEnumeration(name="SwComponentKind", package=distinct_str(package))
+        third = AutosarClass(name=distinct_str("SwComponentType"), package="M2::Other", is_abstract=True)
+
+        assert first.package == "M2::AUTOSARTemplates::SWComponentTemplate"
+        assert first.package is second.package
+        assert first.name is third.name
+
+        assert AutosarPackage(name=distinct_str("M2Package")).name is AutosarPackage(name=distinct_str("M2Package")).name
+
 
 class TestAutosarEnumeration:
     """Tests for AutosarEnumeration class.
@@ -1973,6 +2036,7 @@ class TestAutosarPackage:
         assert "TestPackage" in result
         assert "1 types" in result
         assert "1 subpackages" in result
+        assert result == "Package 'TestPackage' (1 types, 1 subpackages)"
 
     def test_str_empty_package(self) -> None:
         """Test string representation of empty package.
@@ -1983,6 +2047,7 @@ class TestAutosarPackage:
         pkg = AutosarPackage(name="EmptyPackage")
         result = str(pkg)
         assert "EmptyPackage" in result
+        assert result == "Package 'EmptyPackage'"
 
     def test_repr(self) -> None:
         """Test __repr__ method.
@@ -2424,6 +2489,112 @@ class TestAutosarPackage:
         assert pkg.has_class("MyClass") is True
         assert pkg.has_class("MyEnum") is False
 
+    def test_lookups_use_constructor_contents(self) -> None:
+        """Test that types and subpackages passed to the constructor can be queried.
+
+        Requirements:
+            SWR_MODEL_00033: Indexed Package Queries
+        """
+        cls = AutosarClass(name="Class1", package="M2::Test", is_abstract=False)
+        enum = AutosarEnumeration(name="Enum1", package="M2::Test")
+        subpkg = AutosarPackage(name="SubPackage")
+        pkg = AutosarPackage(name="TestPackage", types=[cls, enum], subpackages=[subpkg])
+
+        assert pkg.get_type("Class1") is cls
+        assert pkg.get_class("Class1") is cls
+        assert pkg.get_enumeration("Enum1") is enum
+        assert pkg.get_subpackage("SubPackage") is subpkg
+        assert pkg.has_type("Enum1")
+        assert pkg.has_subpackage("SubPackage")
+
+        # Lookups by kind only return types of that kind
+        assert pkg.get_class("Enum1") is None
+        assert pkg.get_primitive("Class1") is None
+        assert not pkg.has_enumeration("Class1")
+
+    def test_lookups_follow_added_contents(self) -> None:
+        """Test that types and subpackages added later can be queried.
+
+        Requirements:
+            SWR_MODEL_00033: Indexed Package Queries
+        """
+        pkg = AutosarPackage(name="TestPackage")
+        primitive = AutosarPrimitive(name="Limit", package="M2::Test")
+        subpkg = AutosarPackage(name="SubPackage")
+        pkg.add_primitive(primitive)
+        pkg.add_subpackage(subpkg)
+
+        assert pkg.get_primitive("Limit") is primitive
+        assert pkg.has_primitive("Limit")
+        assert pkg.get_subpackage("SubPackage") is subpkg
+
+        # A duplicate type keeps the first definition in the index
+        pkg.add_type(AutosarPrimitive(name="Limit", package="M2::Other"))
+        assert pkg.get_primitive("Limit") is primitive
+        assert len(pkg.types) == 1
+
+    def test_lookups_follow_direct_list_changes(self) -> None:
+        """Test that types and subpackages changed through the lists can be queried.
+
+        Requirements:
+            SWR_MODEL_00033: Indexed Package Queries
+        """
+        pkg = AutosarPackage(name="TestPackage")
+        pkg.add_class(AutosarClass(name="Class1", package="M2::Test", is_abstract=False))
+        cls = AutosarClass(name="Class2", package="M2::Test", is_abstract=False)
+        subpkg = AutosarPackage(name="SubPackage")
+
+        pkg.types.append(cls)
+        pkg.subpackages.append(subpkg)
+        assert pkg.get_class("Class2") is cls
+        assert pkg.has_type("Class2")
+        assert pkg.get_subpackage("SubPackage") is subpkg
+
+        # Removed entries are no longer found
+        pkg.types.pop()
+        pkg.subpackages.clear()
+        assert not pkg.has_class("Class2")
+        assert pkg.get_subpackage("SubPackage") is None
+        pkg.add_subpackage(subpkg)
+        assert pkg.has_subpackage("SubPackage")
+
+        # Entries replaced in place are seen
+        class3 = AutosarClass(name="Class3", package="M2::Test", is_abstract=False)
+        pkg.types[0] = class3
+        assert pkg.get_class("Class1") is None
+        assert pkg.get_class("Class3") is class3
+        pkg.subpackages[0] = AutosarPackage(name="OtherPackage")
+        assert not pkg.has_subpackage("SubPackage")
+        assert pkg.has_subpackage("OtherPackage")
+
+        # Removing and appending, which keeps the length, is seen
+        pkg.types.pop()
+        pkg.types.append(cls)
+        assert not pkg.has_class("Class3")
+        assert pkg.get_class("Class2") is cls
+        pkg.add_class(class3)
+        assert pkg.types == [cls, class3]
+
+        # Replaced lists are searched
+        enum = AutosarEnumeration(name="Enum1", package="M2::Test")
+        pkg.types = [enum]
+        assert pkg.get_enumeration("Enum1") is enum
+        assert pkg.get_class("Class2") is None
+
+    def test_slotted_instance(self) -> None:
+        """Test that package instances use slots and survive pickling.
+
+        Requirements:
+            SWR_MODEL_00032: Slotted Model Instances
+        """
+        pkg = AutosarPackage(name="TestPackage")
+        pkg.add_class(AutosarClass(name="Class1", package="M2::Test", is_abstract=False))
+        assert not hasattr(pkg, "__dict__")
+
+        restored = pickle.loads(pickle.dumps(pkg))
+        assert restored.name == "TestPackage"
+        assert restored.get_class("Class1") is not None
+
 
 class TestAutosarDoc:
     """Test cases for AutosarDoc dataclass.
@@ -2461,7 +2632,7 @@ class TestAutosarDoc:
         pkg1 = AutosarPackage(name="DuplicatePackage")
         pkg2 = AutosarPackage(name="DuplicatePackage")
 
-        with pytest.raises(ValueError, match="Duplicate package names found"):
+        with pytest.raises(ValueError, match="Duplicate package names found in packages: 'DuplicatePackage'"):
             AutosarDoc(packages=[pkg1, pkg2], root_classes=[])
 
     def test_init_duplicate_root_classes_error(self) -> None:
@@ -2473,7 +2644,7 @@ class TestAutosarDoc:
         root_cls1 = AutosarClass(name="DuplicateClass", package="M2::Test", is_abstract=False)
         root_cls2 = AutosarClass(name="DuplicateClass", package="M2::Test", is_abstract=False)
 
-        with pytest.raises(ValueError, match="Duplicate root class names found"):
+        with pytest.raises(ValueError, match="Duplicate root class names found in root_classes: 'DuplicateClass'"):
             AutosarDoc(packages=[], root_classes=[root_cls1, root_cls2])
 
     def test_get_package_found(self) -> None:
@@ -2532,6 +2703,45 @@ class TestAutosarDoc:
 
         assert result is None
 
+    def test_lookups_follow_direct_list_changes(self) -> None:
+        """Test that packages and root classes changed through the lists can be queried.
+
+        Requirements:
+            SWR_MODEL_00023: AUTOSAR Document Representation
+        """
+        pkg = AutosarPackage(name="Package1")
+        root_cls = AutosarClass(name="RootClass1", package="M2::Test", is_abstract=False)
+        doc = AutosarDoc(packages=[], root_classes=[])
+
+        doc.packages.append(pkg)
+        doc.root_classes.append(root_cls)
+        assert doc.get_package("Package1") is pkg
+        assert doc.get_root_class("RootClass1") is root_cls
+
+        # Removed entries are no longer found
+        doc.packages.clear()
+        doc.root_classes.pop()
+        assert doc.get_package("Package1") is None
+        assert doc.get_root_class("RootClass1") is None
+
+        # Replaced lists are searched
+        doc.packages = [pkg]
+        doc.root_classes = [root_cls]
+        assert doc.get_package("Package1") is pkg
+
+        # Entries replaced in place are seen
+        pkg2 = AutosarPackage(name="Package2")
+        doc.packages[0] = pkg2
+        assert doc.get_package("Package1") is None
+        assert doc.get_package("Package2") is pkg2
+
+        # Removing and appending, which keeps the length, is seen
+        root_cls2 = AutosarClass(name="RootClass2", package="M2::Test", is_abstract=False)
+        doc.root_classes.pop()
+        doc.root_classes.append(root_cls2)
+        assert doc.get_root_class("RootClass1") is None
+        assert doc.get_root_class("RootClass2") is root_cls2
+
     def test_str_returns_summary(self) -> None:
         """Test __str__ returns document summary.
 
@@ -2577,6 +2787,29 @@ class TestAutosarDoc:
         assert len(doc.root_classes) == 0
         assert str(doc) == "AutosarDoc(0 packages, 0 root classes)"
 
+    def test_slotted_instances(self) -> None:
+        """Test that the remaining model types use slots and survive pickling.
+
+        Requirements:
+            SWR_MODEL_00032: Slotted Model Instances
+        """
+        source = AutosarDocumentSource("AUTOSAR_CP_TPS_Test.pdf", 7, standard_release="R23-11")
+        literal = AutosarEnumLiteral("VALUE1", index=0, tags={"xml.name": "VALUE-1"}, value="VALUE-1")
+        enum = AutosarEnumeration("MyEnum", "M2::Test", enumeration_literals=[literal], sources=[source])
+        primitive = AutosarPrimitive("Limit", "M2::Test")
+        attr = AutosarAttribute("id", "uint32", False, "0..1", AttributeKind.ATTR, "Unique identifier")
+        root = AutosarClass("RootClass", "M2::Test", attributes={"id": attr})
+        pkg = AutosarPackage(name="Test", types=[enum, primitive, root])
+        doc = AutosarDoc(packages=[pkg], root_classes=[root])
+
+        for obj in (source, literal, enum, primitive, attr, doc):
+            assert not hasattr(obj, "__dict__"), type(obj).__name__
+            assert pickle.loads(pickle.dumps(obj)) == obj
+
+        restored = pickle.loads(pickle.dumps(doc))
+        assert restored.get_package("Test").get_enumeration("MyEnum").enumeration_literals[0].value == "VALUE-1"
+        assert restored.get_root_class("RootClass").attributes["id"].type == "uint32"
+
 
 class TestAutosarDocumentSource:
     """Tests for AutosarDocumentSource class.
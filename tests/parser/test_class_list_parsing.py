@@ -304,3 +304,27 @@ class TestClassListParsing:
         assert test_class.implements == []
         # All should be in bases field
         assert test_class.bases == ["RegularBase1", "RegularBase2"]
+
+    def test_finalize_pending_class_lists_interns_names(self, distinct_str) -> None:
+        """SWUT_PARSER_00104: Verify equal class list names share one string object.
+
+        Requirements:
+            SWR_PARSER_00038: Shared Type Name Strings
+        """
+        from autosar_pdf2txt.models import AutosarClass
+
+        parser = AutosarClassParser()
+        first_class = AutosarClass(name="FirstClass", package="TestPackage")
+        second_class = AutosarClass(name="SecondClass", package="TestPackage")
+
+        first_base = distinct_str("Identifiable")
+        second_base = distinct_str("Identifiable")
+
+        parser._pending_class_lists["base_classes"] = ([first_base], first_base, True)
+        parser._finalize_pending_class_lists(first_class)
+        parser._pending_class_lists["base_classes"] = ([second_base], second_base, True)
+        parser._finalize_pending_class_lists(second_class)
+
+        assert first_class.bases == ["Identifiable"]
+        assert second_class.bases == ["Identifiable"]
+        assert first_class.bases[0] is second_class.bases[0]
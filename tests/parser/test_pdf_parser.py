@@ -3,15 +3,18 @@
 Test coverage for pdf_parser.py targeting PDF parsing functionality.
 """
 
+import logging
 import pytest
+from pathlib import Path
 from unittest.mock import patch
-from typing import List, Union
+from typing import Dict, List, Union
 
 from autosar_pdf2txt.models import ATPType, AttributeKind, AutosarClass, AutosarEnumeration, AutosarPrimitive, AutosarPackage, AutosarDocumentSource
 from autosar_pdf2txt.parser import PdfParser
 from autosar_pdf2txt.parser.class_parser import AutosarClassParser
 from autosar_pdf2txt.parser.enumeration_parser import AutosarEnumerationParser
 from autosar_pdf2txt.parser.primitive_parser import AutosarPrimitiveParser
+from autosar_pdf2txt.parser.pdf_parser import _resolve_worker_count
 # ClassDefinition removed - using model objects directly
 
 
@@ -117,6 +120,92 @@ def _parse_primitive_text(text: str) -> List[AutosarPrimitive]:
     return primitives
 
 
+# Words of a single PDF page defining TestClass in package AUTOSAR::Module
+_TEST_CLASS_WORDS = [
+    {'text': 'Class', 'top': 0, 'x0': 0, 'x1': 40},
+    {'text': 'TestClass', 'top': 0, 'x0': 45, 'x1': 105},
+    {'text': 'Package', 'top': 20, 'x0': 0, 'x1': 55},
+    {'text': 'AUTOSAR::Module', 'top': 20, 'x0': 60, 'x1': 160},
+]
+
+
+def _mock_pdfplumber_open(
+    monkeypatch: pytest.MonkeyPatch,
+    words_by_path: Dict[str, List[dict]] | None = None,
+    open_calls: List[str] | None = None,
+) -> None:
+    """Helper function to replace pdfplumber.open with a single-page mock PDF.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+        words_by_path: Words returned by the page of each PDF path. Every
+            path returns _TEST_CLASS_WORDS if not given.
+        open_calls: Optional list to which every opened path is appended.
+    """
+
+    class MockPage:
+        def __init__(self, words):
+            self._words = words
+
+        def extract_words(self, x_tolerance=1):
+            return self._words
+
+    class MockPdf:
+        def __init__(self, words):
+            self.pages = [MockPage(words)]
+
+    class MockPdfManager:
+        def __init__(self, words):
+            self._words = words
+
+        def __enter__(self):
+            return MockPdf(self._words)
+
+        def __exit__(self, *args):
+            pass
+
+    def mock_open(path, **kwargs):
+        if open_calls is not None:
+            open_calls.append(path)
+        words = _TEST_CLASS_WORDS if words_by_path is None else words_by_path[path]
+        return MockPdfManager(words)
+
+    monkeypatch.setattr("pdfplumber.open", mock_open)
+
+
+def _write_text_pdf(path: Path, lines: List[str]) -> None:
+    """Helper function to write a single-page PDF with one text line per entry.
+
+    The PDF is real, so it can be read by pdfplumber in worker processes
+    that do not see the mocks of the test process.
+
+    Args:
+        path: Path of the PDF file to write.
+        lines: Text lines of the page, from top to bottom.
+    """
+    content = "BT /F1 10 Tf 14 TL 50 750 Td " + " ".join(f"({line}) '" for line in lines) + " ET"
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        (
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            "/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>"
+        ),
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        f"<< /Length {len(content)} >>\nstream\n{content}\nendstream",
+    ]
+    data = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += f"{number} 0 obj\n{obj}\nendobj\n".encode("latin-1")
+    xref_offset = len(data)
+    data += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    data += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    data += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode()
+    path.write_bytes(data)
+
+
 class TestPdfParser:
     """Tests for PdfParser class.
 
@@ -687,28 +776,7 @@ class TestPdfParser:
         parser = PdfParser()
 
         # Mock pdfplumber.open to return test data
-        class MockPage:
-            def extract_words(self, x_tolerance=1):
-                # Return words that simulate proper extraction with spaces
-                return [
-                    {'text': 'Class', 'top': 0, 'x0': 0, 'x1': 40},
-                    {'text': 'TestClass', 'top': 0, 'x0': 45, 'x1': 105},
-                    {'text': 'Package', 'top': 20, 'x0': 0, 'x1': 55},
-                    {'text': 'AUTOSAR::Module', 'top': 20, 'x0': 60, 'x1': 160},
-                ]
-
-        class MockPdf:
-            pages = [MockPage()]
-
-        def mock_open(path, **kwargs):
-            class MockPdfManager:
-                def __enter__(self):
-                    return MockPdf()
-                def __exit__(self, *args):
-                    pass
-            return MockPdfManager()
-
-        monkeypatch.setattr("pdfplumber.open", mock_open)
+        _mock_pdfplumber_open(monkeypatch)
 
         # Parse the PDF
         doc = parser.parse_pdf("dummy.pdf")
@@ -718,6 +786,107 @@ class TestPdfParser:
         assert len(packages) == 1
         assert packages[0].name == "AUTOSAR"
 
+    def test_parse_pdf_without_cache_dir_reads_file(self, monkeypatch, tmp_path) -> None:
+        """Test that the text of a PDF is extracted on every parse without a cache directory.
+
+        SWUT_PARSER_00101: Test PDF Text Extraction Without Cache Directory
+
+        Requirements:
+            SWR_PARSER_00037: Persistent PDF Text Cache
+        """
+        pdf_file = tmp_path / "uncached.pdf"
+        pdf_file.write_bytes(b"%PDF-1.4")
+        open_calls: List[str] = []
+        _mock_pdfplumber_open(monkeypatch, open_calls=open_calls)
+
+        parser = PdfParser()
+        first_doc = parser.parse_pdf(str(pdf_file))
+        second_doc = parser.parse_pdf(str(pdf_file))
+        assert len(open_calls) == 2
+        assert first_doc.packages[0].name == second_doc.packages[0].name == "AUTOSAR"
+        # Each parse builds its own model objects
+        assert first_doc.packages[0] is not second_doc.packages[0]
+
+    def test_parse_pdf_reuses_text_from_cache_dir(self, monkeypatch, tmp_path) -> None:
+        """Test that text stored in a cache directory is reused across runs.
+
+        SWUT_PARSER_00103: Test Persistent PDF Text Cache
+
+        Requirements:
+            SWR_PARSER_00037: Persistent PDF Text Cache
+        """
+        pdf_file = tmp_path / "cached.pdf"
+        pdf_file.write_bytes(b"%PDF-1.4")
+        cache_dir = tmp_path / "cache"
+        open_calls: List[str] = []
+        _mock_pdfplumber_open(monkeypatch, open_calls=open_calls)
+
+        first_doc = PdfParser(cache_dir=cache_dir).parse_pdf(str(pdf_file))
+        cache_files = list(cache_dir.glob("*.json"))
+        assert len(cache_files) == 1
+
+        # A new run (new parser) reads the text from the cache directory
+        second_doc = PdfParser(cache_dir=cache_dir).parse_pdf(str(pdf_file))
+        assert len(open_calls) == 1
+        assert first_doc.packages[0].get_subpackage("Module").get_class("TestClass") is not None
+        assert second_doc.packages[0].get_subpackage("Module").get_class("TestClass") is not None
+
+        # An unreadable cache file is ignored and rewritten
+        cache_files[0].write_text("not json", encoding="utf-8")
+        PdfParser(cache_dir=cache_dir).parse_pdf(str(pdf_file))
+        assert len(open_calls) == 2
+        assert "TestClass" in cache_files[0].read_text(encoding="utf-8")
+
+    def test_text_cache_key_includes_backend_versions(self, monkeypatch, tmp_path) -> None:
+        """Test that cached text is not reused after a PDF backend upgrade.
+
+        SWUT_PARSER_00107: Test Persistent PDF Text Cache Backend Versions
+
+        Requirements:
+            SWR_PARSER_00037: Persistent PDF Text Cache
+        """
+        import pdfminer
+        import pdfplumber
+
+        pdf_file = tmp_path / "cached.pdf"
+        pdf_file.write_bytes(b"%PDF-1.4")
+        cache_dir = tmp_path / "cache"
+        open_calls: List[str] = []
+        _mock_pdfplumber_open(monkeypatch, open_calls=open_calls)
+
+        PdfParser(cache_dir=cache_dir).parse_pdf(str(pdf_file))
+        monkeypatch.setattr(pdfplumber, "__version__", "0.0.0-upgraded")
+        PdfParser(cache_dir=cache_dir).parse_pdf(str(pdf_file))
+        monkeypatch.setattr(pdfminer, "__version__", "0.0.0-upgraded", raising=False)
+        PdfParser(cache_dir=cache_dir).parse_pdf(str(pdf_file))
+
+        assert len(open_calls) == 3
+        assert len(list(cache_dir.glob("*.json"))) == 3
+
+    def test_text_cache_write_failure_removes_temp_file(self, monkeypatch, tmp_path, caplog) -> None:
+        """Test that a failed cache write warns and leaves no temporary file.
+
+        SWUT_PARSER_00108: Test Persistent PDF Text Cache Write Failure
+
+        Requirements:
+            SWR_PARSER_00037: Persistent PDF Text Cache
+        """
+        pdf_file = tmp_path / "cached.pdf"
+        pdf_file.write_bytes(b"%PDF-1.4")
+        cache_dir = tmp_path / "cache"
+        _mock_pdfplumber_open(monkeypatch)
+
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("autosar_pdf2txt.parser.pdf_parser.os.replace", failing_replace)
+
+        doc = PdfParser(cache_dir=cache_dir).parse_pdf(str(pdf_file))
+
+        assert doc.packages[0].get_subpackage("Module").get_class("TestClass") is not None
+        assert list(cache_dir.iterdir()) == []
+        assert "Failed to write PDF text cache file" in caplog.text
+
     def test_build_package_with_empty_parts(self) -> None:
         """Test that empty package parts are skipped.
 
@@ -813,6 +982,23 @@ class TestPdfParser:
         assert class_defs[0].name == "MyPrototype"
         assert class_defs[0].atp_type == ATPType.ATP_PROTO
 
+    def test_extract_class_with_repeated_atp_marker(self) -> None:
+        """Test extracting class with the same ATP marker repeated.
+
+        SWUT_PARSER_00105: Test Extracting Class with Repeated ATP Marker
+
+        Requirements:
+            SWR_PARSER_00004: Class Definition Pattern Recognition
+        """
+        text = """
+        Class MyClass <<atpVariation>> <<atpVariation>>
+        Package M2::AUTOSAR::DataTypes
+        """
+        class_defs = _parse_class_text(text)
+        assert len(class_defs) == 1
+        assert class_defs[0].name == "MyClass"
+        assert class_defs[0].atp_type == ATPType.ATP_VARIATION
+
     def test_extract_class_with_both_atp_patterns_raises_error(self) -> None:
         """Test extracting class with both ATP patterns raises validation error.
 
@@ -1960,6 +2146,85 @@ class TestPdfParser:
             # Verify _extract_models was called twice (once per PDF)
             assert mock_extract.call_count == 2
 
+    def test_parse_pdfs_with_workers_matches_sequential(self, tmp_path) -> None:
+        """Test that parse_pdfs() with several worker processes merges PDFs in input order.
+
+        SWUT_PARSER_00102: Test Parallel PDF File Parsing
+
+        Requirements:
+            SWR_PARSER_00036: Parallel PDF File Parsing
+        """
+        pdf1 = tmp_path / "pdf1.pdf"
+        pdf2 = tmp_path / "pdf2.pdf"
+        _write_text_pdf(pdf1, ["Class ChildClass", "Package AUTOSAR::Derived", "Base ParentClass"])
+        _write_text_pdf(pdf2, ["Class ParentClass", "Package AUTOSAR::Base"])
+        pdf_paths = [str(pdf1), str(pdf2)]
+
+        sequential_doc = PdfParser().parse_pdfs(pdf_paths)
+        parallel_doc = PdfParser().parse_pdfs(pdf_paths, max_workers=2)
+
+        assert [pkg.name for pkg in parallel_doc.packages] == [pkg.name for pkg in sequential_doc.packages]
+        root = parallel_doc.packages[0]
+        assert [sub.name for sub in root.subpackages] == ["Derived", "Base"]
+        child_class = root.get_subpackage("Derived").get_class("ChildClass")
+        assert child_class.parent == "ParentClass"
+        assert [source.pdf_file for source in child_class.sources] == ["pdf1.pdf"]
+        assert [cls.name for cls in parallel_doc.root_classes] == ["ParentClass"]
+
+    def test_parse_pdfs_forwards_worker_logging(self, tmp_path, caplog) -> None:
+        """Test that log records of worker processes reach the handlers of the parsing process.
+
+        SWUT_PARSER_00109: Test Parallel PDF File Parsing Logging
+
+        Requirements:
+            SWR_PARSER_00036: Parallel PDF File Parsing
+        """
+        pdf_paths = []
+        for class_name in ("FirstClass", "SecondClass"):
+            pdf_file = tmp_path / f"{class_name}.pdf"
+            _write_text_pdf(pdf_file, [f"Class {class_name}", "Package AUTOSAR::Module"])
+            pdf_paths.append(str(pdf_file))
+        # A file in place of the cache directory makes every worker log a warning
+        cache_dir = tmp_path / "not_a_directory"
+        cache_dir.write_text("")
+
+        with caplog.at_level(logging.WARNING):
+            doc = PdfParser(cache_dir=cache_dir).parse_pdfs(pdf_paths, max_workers=2)
+
+        module = doc.packages[0].get_subpackage("Module")
+        assert [typ.name for typ in module.types] == ["FirstClass", "SecondClass"]
+        write_failures = [
+            record for record in caplog.records if "Failed to write PDF text cache file" in record.getMessage()
+        ]
+        assert len(write_failures) == 2
+        assert {record.name for record in write_failures} == {"autosar_pdf2txt.parser.pdf_parser"}
+
+    def test_parse_pdfs_rejects_invalid_worker_count(self) -> None:
+        """Test that parse_pdfs() rejects a worker count below 1.
+
+        SWUT_PARSER_00102: Test Parallel PDF File Parsing
+
+        Requirements:
+            SWR_PARSER_00036: Parallel PDF File Parsing
+        """
+        with pytest.raises(ValueError, match="max_workers must be at least 1"):
+            PdfParser().parse_pdfs(["pdf1.pdf"], max_workers=0)
+
+    def test_resolve_worker_count(self) -> None:
+        """Test the worker count is capped by the number of PDFs.
+
+        SWUT_PARSER_00102: Test Parallel PDF File Parsing
+
+        Requirements:
+            SWR_PARSER_00036: Parallel PDF File Parsing
+        """
+        assert _resolve_worker_count(1, 5) == 1
+        assert _resolve_worker_count(8, 3) == 3
+        assert _resolve_worker_count(4, 0) == 1
+        with patch("autosar_pdf2txt.parser.pdf_parser._available_cpu_count", return_value=6):
+            assert _resolve_worker_count(None, 10) == 6
+            assert _resolve_worker_count(None, 2) == 2
+
     def test_parent_resolution_ancestry_based_filters_ancestors_from_bases(self) -> None:
         """Test that ancestry-based parent selection correctly identifies direct parent vs ancestors.
 
@@ -4781,6 +5046,22 @@ class TestBaseParserCoverage:
         assert parser._is_broken_attribute_fragment("SizeProfile", "Integer")
         assert parser._is_broken_attribute_fragment("isStructWith", "Boolean")
 
+    def test_add_attribute_keys_by_interned_name(self, distinct_str) -> None:
+        """Test _add_attribute_if_valid keys attributes by the attribute's own name.
+
+        SWUT_PARSER_00106: Test Attribute Dictionary Keyed by Interned Name
+
+        Requirements:
+            SWR_MODEL_00034: Shared Name and Package Path Strings
+        """
+        parser = AutosarClassParser()
+        attributes: dict = {}
+        parser._add_attribute_if_valid(attributes, distinct_str("shortName"), "Identifier", "0..1", AttributeKind.ATTR, "Name")
+
+        assert list(attributes) == ["shortName"]
+        key = next(iter(attributes))
+        assert key is attributes["shortName"].name
+
     def test_valid_type_definition_invalid_line(self) -> None:
         """Test _is_valid_type_definition rejects invalid lines.
 